@@ -2,21 +2,92 @@ from typing import Optional, Tuple
 
 from checkers_bot_tournament.board_start_builder import BoardStartBuilder
 from checkers_bot_tournament.move import Move
-from checkers_bot_tournament.piece import Colour, Piece
+from checkers_bot_tournament.piece import (
+    BLACK_MAN,
+    EMPTY,
+    KING,
+    WHITE_MAN,
+    Colour,
+    Piece,
+    man_code,
+    piece_from_code,
+)
 
 Grid = list[list[Optional[Piece]]]
 
+# Board.display's character for each square code
+DISPLAY_CHARS = {
+    EMPTY: ".",
+    WHITE_MAN: "w",
+    WHITE_MAN | KING: "W",
+    BLACK_MAN: "b",
+    BLACK_MAN | KING: "B",
+}
+
 
 class Board:
     def __init__(self, board_start_builder: BoardStartBuilder, size: int = 8):
         self.size = size  # Note that size must always be even
         if size % 2 != 0:
             raise ValueError("Even board sizes only.")
-
-        self.grid: Grid = board_start_builder.build()
+        self.half = size // 2
+
+        # One byte per dark square, numbered like PDN squares (minus one), holding the
+        # square codes in piece.py
+        self.squares: bytearray = board_start_builder.build()
+        # Indices of the squares each colour has a piece on, kept up to date by move_piece
+        self.white_pieces: set[int] = set()
+        self.black_pieces: set[int] = set()
+        for index, code in enumerate(self.squares):
+            if code & WHITE_MAN:
+                self.white_pieces.add(index)
+            elif code & BLACK_MAN:
+                self.black_pieces.add(index)
 
         self.move_history: list[Move] = []
 
+    def __deepcopy__(self, memo: dict) -> "Board":
+        board = Board.__new__(Board)
+        board.size = self.size
+        board.half = self.half
+        board.squares = self.squares.copy()
+        board.white_pieces = self.white_pieces.copy()
+        board.black_pieces = self.black_pieces.copy()
+        # Moves are never changed once made, so the copy can share them
+        board.move_history = self.move_history.copy()
+        return board
+
+    def pieces(self, colour: Colour) -> set[int]:
+        """Indices into squares of colour's pieces."""
+        return self.white_pieces if colour == Colour.WHITE else self.black_pieces
+
+    def count_pieces(self, colour: Colour) -> Tuple[int, int]:
+        """Number of (men, kings) colour has."""
+        pieces = self.pieces(colour)
+        kings = sum(1 for index in pieces if self.squares[index] & KING)
+        return len(pieces) - kings, kings
+
+    def square_index(self, row: int, col: int) -> int:
+        """Index into squares of the dark square at (row, col)."""
+        return row * self.half + col // 2
+
+    def square_position(self, index: int) -> Tuple[int, int]:
+        row = index // self.half
+        return row, 2 * (index % self.half) + 1 - row % 2
+
+    @property
+    def grid(self) -> Grid:
+        """
+        The board as rows of Pieces, for bots written against the old representation. This
+        is built on every access and changing it doesn't change the board.
+        """
+        grid: Grid = [[None] * self.size for _ in range(self.size)]
+        for index, code in enumerate(self.squares):
+            if code != EMPTY:
+                row, col = self.square_position(index)
+                grid[row][col] = piece_from_code(code, (row, col))
+        return grid
+
     def move_piece(self, move: Move) -> Tuple[bool, bool]:
         """
         Assume move is valid
@@ -24,15 +95,18 @@ class Board:
 
         Returns True if capture or promotion occured, else False
         """
-        start_row, start_col = move.start
+        start = self.square_index(*move.start)
         end_row, end_col = move.end
-        piece = self.grid[start_row][start_col]
-        assert piece is not None
+        end = self.square_index(end_row, end_col)
+        code = self.squares[start]
+        assert code != EMPTY
 
         # Perform the move
-        self.grid[start_row][start_col] = None
-        self.grid[end_row][end_col] = piece
-        piece.position = move.end
+        self.squares[start] = EMPTY
+        self.squares[end] = code
+        own_pieces = self.white_pieces if code & WHITE_MAN else self.black_pieces
+        own_pieces.remove(start)
+        own_pieces.add(end)
 
         # Add move to move_history
         self.move_history.append(move)
@@ -41,23 +115,27 @@ class Board:
         promotion = False
 
         if move.removed:
-            rem_row, rem_col = move.removed
-            self.grid[rem_row][rem_col] = None
+            removed = self.square_index(*move.removed)
+            self.squares[removed] = EMPTY
+            self.white_pieces.discard(removed)
+            self.black_pieces.discard(removed)
             capture = True
 
         # Promote to king
-        if (not piece.is_king) and (
-            (piece.colour == Colour.WHITE and end_row == 0)
-            or (piece.colour == Colour.BLACK and end_row == self.size - 1)
+        if (not code & KING) and (
+            (code == WHITE_MAN and end_row == 0) or (code == BLACK_MAN and end_row == self.size - 1)
         ):
-            piece.is_king = True
+            self.squares[end] = code | KING
             promotion = True
 
         return (capture, promotion)
 
     def add_regular_move(self, moves: list[Move], row: int, col: int, dr: int, dc: int):
         end_row, end_col = row + dr, col + dc
-        if self.is_within_bounds(end_row, end_col) and self.grid[end_row][end_col] is None:
+        if (
+            self.is_within_bounds(end_row, end_col)
+            and self.squares[self.square_index(end_row, end_col)] == EMPTY
+        ):
             moves.append(Move((row, col), (end_row, end_col), None))
 
     def add_capture_move(
@@ -68,11 +146,11 @@ class Board:
             return
 
         mid_row, mid_col = row + dr, col + dc
-        mid_piece: Optional[Piece] = self.grid[mid_row][mid_col]
+        mid_code = self.squares[self.square_index(mid_row, mid_col)]
         valid_capture_move = (
-            self.grid[capture_row][capture_col] is None
-            and mid_piece is not None
-            and mid_piece.colour != colour
+            self.squares[self.square_index(capture_row, capture_col)] == EMPTY
+            and mid_code != EMPTY
+            and not mid_code & man_code(colour)
         )
 
         if valid_capture_move:
@@ -95,15 +173,14 @@ class Board:
         # Directions for kings (can move in all four diagonals)
         king_directions = forward_directions + [(-d[0], -d[1]) for d in forward_directions]
 
-        for row in range(self.size):
-            for col in range(self.size):
-                piece = self.get_piece((row, col))
-                if piece and piece.colour == colour:
-                    directions = king_directions if piece.is_king else forward_directions
+        # In square order, so moves come out in the same order as scanning the board
+        for index in sorted(self.pieces(colour)):
+            row, col = self.square_position(index)
+            directions = king_directions if self.squares[index] & KING else forward_directions
 
-                    for dr, dc in directions:
-                        self.add_regular_move(moves, row, col, dr, dc)
-                        self.add_capture_move(moves, colour, row, col, dr, dc)
+            for dr, dc in directions:
+                self.add_regular_move(moves, row, col, dr, dc)
+                self.add_capture_move(moves, colour, row, col, dr, dc)
 
         # Funny rule in checkers, if there is a capture move available, you MUST
         # take it, so here, if there are any capture moves, we filter to only
@@ -122,36 +199,23 @@ class Board:
     def get_piece(self, position: Tuple[int, int]) -> Optional[Piece]:
         """Return the piece at a specific position."""
         row, col = position
-        return self.grid[row][col] if 0 <= row < self.size and 0 <= col < self.size else None
+        if not self.is_within_bounds(row, col) or (row + col) % 2 == 0:
+            return None
+        code = self.squares[self.square_index(row, col)]
+        return piece_from_code(code, position) if code != EMPTY else None
 
     def get_move_history(self) -> list[Move]:
         return self.move_history
 
-    def display_cell(self, cell: Optional[Piece], x: int, y: int) -> str:
-        if not cell:
-            if (x + y) % 2 == 0:
-                return " "
-            else:
-                return "."
-
-        match (cell.colour, cell.is_king):
-            case (Colour.WHITE, False):
-                return "w"
-            case (Colour.WHITE, True):
-                return "W"
-            case (Colour.BLACK, False):
-                return "b"
-            case (Colour.BLACK, True):
-                return "B"
-            case _:
-                raise ValueError("Unexpected piece state encountered.")
-
     def display(self) -> str:
-        # Looks disgusting but yay pythom
-        return (
-            "\n".join(
-                " ".join(self.display_cell(cell, x, y) for x, cell in enumerate(row))
-                for y, row in enumerate(self.grid)
+        lines = []
+        for row in range(self.size):
+            lines.append(
+                " ".join(
+                    DISPLAY_CHARS[self.squares[self.square_index(row, col)]]
+                    if (row + col) % 2 == 1
+                    else " "
+                    for col in range(self.size)
+                )
             )
-            + "\n"
-        )
+        return "\n".join(lines) + "\n"
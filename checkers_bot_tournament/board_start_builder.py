@@ -1,51 +1,46 @@
 from abc import ABC
-from typing import Optional
+from typing import Dict, Type
 
-from checkers_bot_tournament.piece import Colour, Piece
-
-Grid = list[list[Optional[Piece]]]
+from checkers_bot_tournament.piece import BLACK_MAN, WHITE_MAN
 
 
 class BoardStartBuilder(ABC):
     def __init__(self, size: int = 8) -> None:
         self.size = size
 
-    def build(self) -> Grid:
+    def build(self) -> bytearray:
+        """
+        Returns the starting position as one byte per dark square in PDN order (row by row
+        from black's side), holding the square codes in piece.py.
+        """
         raise RuntimeError("build not implemented yet!")
 
 
 class DefaultBSB(BoardStartBuilder):
-    def build(self) -> Grid:
-        grid: Grid = [[None for _ in range(self.size)] for _ in range(self.size)]
-
-        half = int(self.size / 2)
-        # Init black pieces
-        for row in range(half - 1):
-            for col in range(self.size):
-                if (row + col) % 2 == 1:
-                    grid[row][col] = Piece((row, col), Colour.BLACK)
+    def build(self) -> bytearray:
+        half = self.size // 2
+        squares = bytearray(self.size * half)
 
-        # Init white pieces
-        for row in range(half + 1, self.size):
-            for col in range(self.size):
-                if (row + col) % 2 == 1:
-                    grid[row][col] = Piece((row, col), Colour.WHITE)
+        # Black fills the first half - 1 rows and white the last half - 1
+        filled = (half - 1) * half
+        squares[:filled] = bytes([BLACK_MAN]) * filled
+        squares[len(squares) - filled :] = bytes([WHITE_MAN]) * filled
 
-        return grid
+        return squares
 
 
 class LastRowBSB(BoardStartBuilder):
-    def build(self) -> Grid:
-        grid: Grid = [[None for _ in range(self.size)] for _ in range(self.size)]
+    def build(self) -> bytearray:
+        half = self.size // 2
+        squares = bytearray(self.size * half)
+
+        squares[:half] = bytes([BLACK_MAN]) * half
+        squares[len(squares) - half :] = bytes([WHITE_MAN]) * half
 
-        # Init black pieces
-        for col in range(self.size):
-            if (0 + col) % 2 == 1:
-                grid[0][col] = Piece((0, col), Colour.BLACK)
+        return squares
 
-        # Init white pieces
-        for col in range(self.size):
-            if (self.size - 1 + col) % 2 == 1:
-                grid[self.size - 1][col] = Piece((self.size - 1, col), Colour.WHITE)
 
-        return grid
+board_start_builder_mapping: Dict[str, Type[BoardStartBuilder]] = {
+    "default": DefaultBSB,
+    "last_row": LastRowBSB,
+}
@@ -0,0 +1,230 @@
+import ast
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import Optional, Type
+
+from checkers_bot_tournament.bots.base_bot import Bot
+
+ENTRY_POINT_GROUP = "checkers_bot_tournament.bots"
+BUILTIN_BOTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bots")
+# Prefix of the module names bots loaded from a file path are imported under
+FILE_MODULE_PREFIX = "_checkers_bot_file_"
+REGISTRY_CACHE_VERSION = 1
+
+
+def default_cache_path() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "checkers-bot-tournament", "bot_registry.json")
+
+
+@dataclass
+class BotEntry:
+    name: str
+    # "package.module:Class" or "/path/to/file.py:Class"
+    spec: str
+    # Where the bot was found: builtin, directory or entry point
+    source: str
+
+
+def scan_bot_classes(source: str, known_bots: Optional[set[str]] = None) -> list[tuple[str, str]]:
+    """
+    Finds bots in Python source without importing it: classes deriving from Bot (or from
+    another bot in known_bots or the same file) whose get_name returns a string literal.
+    Returns (bot name, class name) pairs.
+    """
+    bot_classes = {"Bot"} | (known_bots or set())
+    found: list[tuple[str, str]] = []
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        base_names = {
+            base.id if isinstance(base, ast.Name) else base.attr
+            for base in node.bases
+            if isinstance(base, (ast.Name, ast.Attribute))
+        }
+        if not base_names & bot_classes:
+            continue
+        bot_classes.add(node.name)
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name == "get_name":
+                returns = [stmt for stmt in item.body if isinstance(stmt, ast.Return)]
+                if (
+                    len(returns) == 1
+                    and isinstance(returns[0].value, ast.Constant)
+                    and isinstance(returns[0].value.value, str)
+                ):
+                    found.append((returns[0].value.value, node.name))
+    return found
+
+
+def _import_file(path: str) -> str:
+    """Imports a Python file as a module, returning the module name."""
+    path = os.path.abspath(path)
+    module_name = FILE_MODULE_PREFIX + hashlib.sha1(path.encode()).hexdigest()[:12]
+    if module_name not in sys.modules:
+        module_spec = importlib.util.spec_from_file_location(module_name, path)
+        if module_spec is None or module_spec.loader is None:
+            raise ValueError(f"can't import bot file {path}")
+        module = importlib.util.module_from_spec(module_spec)
+        sys.modules[module_name] = module
+        try:
+            module_spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return module_name
+
+
+def load_bot_class(spec: str) -> Type[Bot]:
+    """Imports the bot class of a "package.module:Class" or "path/to/file.py:Class" spec."""
+    location, _, class_name = spec.rpartition(":")
+    if not location or not class_name:
+        raise ValueError(f"bot spec {spec} is not of the form module:Class or file.py:Class")
+    if location.endswith(".py"):
+        module_name = _import_file(location)
+    else:
+        module_name = location
+    bot_class = getattr(importlib.import_module(module_name), class_name, None)
+    if not (isinstance(bot_class, type) and issubclass(bot_class, Bot)):
+        raise ValueError(f"{spec} is not a Bot")
+    return bot_class
+
+
+def class_spec(bot_class: Type[Bot]) -> str:
+    """The spec load_bot_class loads bot_class from, e.g. in another process."""
+    module = sys.modules[bot_class.__module__]
+    if bot_class.__module__.startswith(FILE_MODULE_PREFIX) and module.__file__:
+        return f"{module.__file__}:{bot_class.__qualname__}"
+    return f"{bot_class.__module__}:{bot_class.__qualname__}"
+
+
+class BotRegistry:
+    """
+    Bots by name, found without importing them: the built-in bots, bots installed by other
+    packages under the checkers_bot_tournament.bots entry point group and bots in any
+    extra directories, in increasing order of precedence. A bot's module is only imported
+    when the bot is loaded.
+
+    Directories are scanned with ast, and what was found in each file is cached by
+    modification time, so only new or changed files are parsed on startup.
+
+    Bots can also be given directly as "package.module:Class", "path/to/file.py:Class" or
+    "path/to/file.py" if the file has one bot.
+    """
+
+    def __init__(
+        self,
+        bot_dirs: Optional[list[str]] = None,
+        cache_path: Optional[str] = None,
+        entry_points: bool = True,
+    ):
+        self.cache_path = cache_path if cache_path is not None else default_cache_path()
+        self.cache = self._read_cache()
+        self.cache_changed = False
+        self.entries: dict[str, BotEntry] = {}
+        self.loaded: dict[str, Type[Bot]] = {}
+
+        self._add_directory(BUILTIN_BOTS_DIR, "builtin")
+        if entry_points:
+            for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+                self.entries[entry_point.name] = BotEntry(
+                    entry_point.name, entry_point.value, "entry point"
+                )
+        for bot_dir in bot_dirs or []:
+            self._add_directory(bot_dir, "directory")
+        self._write_cache()
+
+    def _read_cache(self) -> dict:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return cache.get("files", {}) if cache.get("version") == REGISTRY_CACHE_VERSION else {}
+
+    def _write_cache(self) -> None:
+        if not self.cache_changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump({"version": REGISTRY_CACHE_VERSION, "files": self.cache}, file)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # Only a cache, carry on without it
+            pass
+
+    def _scan_file(self, path: str) -> list[tuple[str, str]]:
+        stat = os.stat(path)
+        cached = self.cache.get(path)
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return [tuple(bot) for bot in cached["bots"]]
+
+        with open(path, "r", encoding="utf-8") as file:
+            try:
+                bots = scan_bot_classes(file.read(), self._known_class_names())
+            except SyntaxError:
+                bots = []
+        self.cache[path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "bots": bots}
+        self.cache_changed = True
+        return bots
+
+    def _known_class_names(self) -> set[str]:
+        return {entry.spec.rpartition(":")[2] for entry in self.entries.values()}
+
+    def _add_directory(self, directory: str, source: str) -> None:
+        if not os.path.isdir(directory):
+            raise ValueError(f"bot directory {directory} does not exist")
+        directory = os.path.abspath(directory)
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith(".py") or file_name.startswith("_"):
+                continue
+            path = os.path.join(directory, file_name)
+            for name, class_name in self._scan_file(path):
+                if source == "builtin":
+                    module = f"{__package__}.bots.{file_name[:-3]}"
+                    spec = f"{module}:{class_name}"
+                else:
+                    spec = f"{path}:{class_name}"
+                self.entries[name] = BotEntry(name, spec, source)
+
+    def names(self) -> list[str]:
+        return sorted(self.entries)
+
+    def register(self, name: str, bot_class: Type[Bot]) -> None:
+        """Adds an already imported bot, e.g. when using the Controller from Python."""
+        self.entries[name] = BotEntry(name, class_spec(bot_class), "registered")
+        self.loaded[name] = bot_class
+
+    def _spec_for(self, bot: str) -> Optional[str]:
+        if bot in self.entries:
+            return self.entries[bot].spec
+        location, _, class_name = bot.rpartition(":")
+        if location and class_name:
+            return bot
+        if bot.endswith(".py") and os.path.isfile(bot):
+            path = os.path.abspath(bot)
+            bots = self._scan_file(path)
+            self._write_cache()
+            if len(bots) == 1:
+                return f"{path}:{bots[0][1]}"
+        return None
+
+    def __contains__(self, bot: str) -> bool:
+        return self._spec_for(bot) is not None
+
+    def load(self, bot: str) -> Type[Bot]:
+        """Imports a bot given by name or spec."""
+        if bot not in self.loaded:
+            spec = self._spec_for(bot)
+            if spec is None:
+                raise ValueError(f"bot {bot} not recognised!")
+            self.loaded[bot] = load_bot_class(spec)
+        return self.loaded[bot]
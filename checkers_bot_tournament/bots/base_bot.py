@@ -1,13 +1,30 @@
+import random
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from checkers_bot_tournament.board import Board
 from checkers_bot_tournament.move import Move
 from checkers_bot_tournament.piece import Colour
 
+if TYPE_CHECKING:
+    from checkers_bot_tournament.opening_book import OpeningBook
+
 
 class Bot(ABC):
+    # Bots running outside the tournament process get the game's board rather than a copy,
+    # since they can't modify it anyway
+    isolated = False
+    # Set by bots whose play_move only depends on its arguments (no randomness and no state
+    # kept between games), so the Controller can reuse the result of a pairing it has seen
+    deterministic = False
+
     def __init__(self, bot_id: int) -> None:
         self.bot_id = bot_id
+        # Set by the Controller when a book is passed with --book
+        self.opening_book: Optional["OpeningBook"] = None
+        # Use this rather than the random module. Games reseed it from the tournament's
+        # --seed, so any game can be replayed whatever order games are played in.
+        self.rng = random.Random()
 
     def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
         """
@@ -21,5 +38,25 @@ class Bot(ABC):
         """
         raise RuntimeError("play_move not implemented!")
 
+    async def play_move_async(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
+        """
+        Used when games are run with Game.run_async. Bots that wait on something outside the
+        process (like ExternalBot) override this so other games can play in the meantime.
+        """
+        return self.play_move(board, colour, move_list)
+
+    def start_game(self, game_id: int) -> None:
+        """Called before every game the bot plays. Does nothing unless a bot needs it."""
+
+    def probe_book(self, board: Board, colour: Colour, move_list: list[Move]) -> Optional[int]:
+        """
+        Returns the index of the book move for this position, or None if there is no book
+        or the position is not in it. Call this at the start of play_move to skip searching
+        known openings.
+        """
+        if self.opening_book is None:
+            return None
+        return self.opening_book.probe(board, colour, move_list)
+
     def get_name(self) -> str:
         raise RuntimeError("get_name not implemented yet!")
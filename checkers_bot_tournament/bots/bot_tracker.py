@@ -1,17 +1,11 @@
 from dataclasses import dataclass
+from enum import IntEnum
 
-from checkers_bot_tournament.bots.base_bot import Bot
-from checkers_bot_tournament.game_result import GameResult, Result
-
+import numpy as np
 
-class EloConfig:
-    STARTING_ELO = 1500.0
-    # Dynamic learning rate as per USCF: K = 800/(Ne + m),
-    # where Ne is effective number of games a player's rating is based on, and
-    # m the number of games the player completed in a tournament for rating consideration
-    STARTING_KFACTOR = 800.0
-    # Each multiple of scale rating difference is a 10x increase in expected score
-    SCALE = 400.0
+from checkers_bot_tournament.bots.base_bot import Bot
+from checkers_bot_tournament.elo import EloConfig, EloRatings
+from checkers_bot_tournament.game_result import Result
 
 
 @dataclass
@@ -41,20 +35,87 @@ class GameResultStat:
         return self.total_wins + self.total_draws + self.total_losses
 
 
+class H2HColumn(IntEnum):
+    WHITE_WIN = 0
+    WHITE_DRAW = 1
+    WHITE_LOSS = 2
+    BLACK_WIN = 3
+    BLACK_DRAW = 4
+    BLACK_LOSS = 5
+
+
+# Results as small integers so a round can be registered as one array
+RESULT_CODES = {Result.WHITE: 0, Result.DRAW: 1, Result.BLACK: 2}
+
+
+class H2HMatrix:
+    """
+    Head-to-head W/D/L by colour for every pair of bots in a single
+    (bots x bots x 6) array, indexed by BotTracker.index.
+
+    counts[i, j] holds bot i's results against bot j, with columns as in H2HColumn.
+    """
+
+    def __init__(self, num_bots: int) -> None:
+        self.counts = np.zeros((num_bots, num_bots, len(H2HColumn)), dtype=np.int64)
+
+    @property
+    def num_bots(self) -> int:
+        return self.counts.shape[0]
+
+    def register(self, white: int, black: int, result: Result) -> None:
+        code = RESULT_CODES[result]
+        self.counts[white, black, H2HColumn.WHITE_WIN + code] += 1
+        self.counts[black, white, H2HColumn.BLACK_LOSS - code] += 1
+
+    def register_results(self, white: np.ndarray, black: np.ndarray, codes: np.ndarray) -> None:
+        """Registers a batch of games given as arrays of indices and RESULT_CODES."""
+        np.add.at(self.counts, (white, black, H2HColumn.WHITE_WIN + codes), 1)
+        np.add.at(self.counts, (black, white, H2HColumn.BLACK_LOSS - codes), 1)
+
+    def stat(self, bot: int, opponent: int) -> GameResultStat:
+        return GameResultStat(*(int(c) for c in self.counts[bot, opponent]))
+
+    def totals(self, bot: int) -> GameResultStat:
+        return GameResultStat(*(int(c) for c in self.counts[bot].sum(axis=0)))
+
+    def wdl(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(wins, draws, losses) matrices over both colours, each bots x bots."""
+        counts = self.counts
+        wins = counts[:, :, H2HColumn.WHITE_WIN] + counts[:, :, H2HColumn.BLACK_WIN]
+        draws = counts[:, :, H2HColumn.WHITE_DRAW] + counts[:, :, H2HColumn.BLACK_DRAW]
+        losses = counts[:, :, H2HColumn.WHITE_LOSS] + counts[:, :, H2HColumn.BLACK_LOSS]
+        return wins, draws, losses
+
+    def scores(self) -> np.ndarray:
+        """Total points (win = 1, draw = 0.5) of every bot."""
+        wins, draws, _ = self.wdl()
+        return wins.sum(axis=1) + 0.5 * draws.sum(axis=1)
+
+
 class BotTracker:
-    def __init__(self, bot: Bot, unique_bot_names: list[str]) -> None:
+    def __init__(self, bot: Bot, h2h: H2HMatrix, elo: EloRatings, index: int) -> None:
         self.bot = bot
-        self.rating: float = EloConfig.STARTING_ELO
-        self.stats = GameResultStat()
-        self.h2h_stats: dict[str, GameResultStat] = {
-            unique_bot_name: GameResultStat() for unique_bot_name in unique_bot_names
-        }
+        # Row of this bot in the shared h2h matrix and rating arrays
+        # (bot ids can be -1 for the hero bot)
+        self.index = index
+        self.h2h = h2h
+        self.elo = elo
 
-        self.games_played = 0
+    @property
+    def rating(self) -> float:
+        return float(self.elo.ratings[self.index])
+
+    @property
+    def games_played(self) -> int:
+        return int(self.elo.games_played[self.index])
 
-        # resets every tournament
-        self.tournament_evs: list[float] = []
-        self.tournament_scores: list[float] = []
+    @property
+    def stats(self) -> GameResultStat:
+        return self.h2h.totals(self.index)
+
+    def h2h_stat(self, other: "BotTracker") -> GameResultStat:
+        return self.h2h.stat(self.index, other.index)
 
     def calculate_ev(self, other: "BotTracker") -> float:
         Qa = 10 ** (self.rating / EloConfig.SCALE)
@@ -62,76 +123,3 @@ class BotTracker:
 
         Ea = Qa / (Qa + Qb)  # Ea + Eb = 1
         return Ea
-
-    def register_ev(self, ev: float) -> None:
-        self.tournament_evs.append(ev)
-
-    def _register_result(self, score: float) -> None:
-        self.tournament_scores.append(score)
-
-    def register_game_result(self, game_result: GameResult):
-        from checkers_bot_tournament.checkers_util import make_unique_bot_string
-
-        unique_name = make_unique_bot_string(self.bot)
-        white_score_lookup = {Result.WHITE: 1, Result.BLACK: 0, Result.DRAW: 0.5}
-
-        match unique_name:
-            case game_result.white_name:
-                # Bot is playing as White
-                self._register_result(white_score_lookup[game_result.result])
-                if game_result.result == Result.WHITE:
-                    # Bot won as White
-                    self.stats.white_wins += 1
-                    self.h2h_stats[game_result.black_name].white_wins += 1
-                elif game_result.result == Result.BLACK:
-                    # Bot lost as White
-                    self.stats.white_losses += 1
-                    self.h2h_stats[game_result.black_name].white_losses += 1
-                elif game_result.result == Result.DRAW:
-                    # Bot drew as White
-                    self.stats.white_draws += 1
-                    self.h2h_stats[game_result.black_name].white_draws += 1
-                else:
-                    raise ValueError(f"Unknown game result: {game_result.result}")
-
-            case game_result.black_name:
-                # Bot is playing as Black
-                self._register_result(1 - white_score_lookup[game_result.result])
-                if game_result.result == Result.BLACK:
-                    # Bot won as Black
-                    self.stats.black_wins += 1
-                    self.h2h_stats[game_result.white_name].black_wins += 1
-                elif game_result.result == Result.WHITE:
-                    # Bot lost as Black
-                    self.stats.black_losses += 1
-                    self.h2h_stats[game_result.white_name].black_losses += 1
-                elif game_result.result == Result.DRAW:
-                    # Bot drew as Black
-                    self.stats.black_draws += 1
-                    self.h2h_stats[game_result.white_name].black_draws += 1
-                else:
-                    raise ValueError(f"Unknown game result: {game_result.result}")
-
-            case _:
-                # Bot's unique name does not match either player in the game result
-                raise ValueError(
-                    f"Unknown bot name {unique_name} does not match "
-                    f"{game_result.white_name=} or {game_result.black_name=}"
-                )
-
-    def update_rating(self) -> None:
-        assert len(self.tournament_evs) == len(self.tournament_scores), (
-            f"{self.tournament_evs} {self.tournament_scores}"
-            "You are supposed to call this after registering all tournament results"
-        )
-
-        tournament_games_played = len(self.tournament_evs)
-        total_ev = sum(self.tournament_evs)
-        total_score = sum(self.tournament_scores)
-
-        K = EloConfig.STARTING_KFACTOR / (self.games_played + tournament_games_played)
-        self.rating += K * (total_score - total_ev)
-
-        self.games_played += tournament_games_played
-        self.tournament_evs = []
-        self.tournament_scores = []
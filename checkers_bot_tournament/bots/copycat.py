@@ -1,5 +1,3 @@
-from random import randint
-
 from checkers_bot_tournament.board import Board
 from checkers_bot_tournament.bots.base_bot import Bot
 from checkers_bot_tournament.move import Move
@@ -38,7 +36,7 @@ class CopyCat(Bot):
 
         # If move history is empty i.e. first move, pick a random move
         if not move_history:
-            return randint(0, len(move_list) - 1)
+            return self.rng.randrange(len(move_list))
 
         prev_move = move_history[-1]
         mirror_move = self.get_mirror_move(board, prev_move)
@@ -47,4 +45,4 @@ class CopyCat(Bot):
         if mirror_move in move_list:
             return move_list.index(mirror_move)
 
-        return randint(0, len(move_list) - 1)
+        return self.rng.randrange(len(move_list))
@@ -0,0 +1,30 @@
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.bots.base_bot import Bot
+from checkers_bot_tournament.engine import EngineError, EnginePool
+from checkers_bot_tournament.move import Move
+from checkers_bot_tournament.piece import Colour
+
+
+class ExternalBot(Bot):
+    """
+    A bot running as a separate engine process (see engine.py). Only plays in games run with
+    Game.run_async, the engine processes are shared with every other instance of the engine.
+    """
+
+    isolated = True
+
+    def __init__(self, bot_id: int, engine: EnginePool) -> None:
+        super().__init__(bot_id)
+        self.engine = engine
+
+    def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
+        raise RuntimeError("external bots can only play in games run with Game.run_async")
+
+    async def play_move_async(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
+        move_idx = await self.engine.play_move(board, colour, move_list)
+        if move_idx < 0 or move_idx >= len(move_list):
+            raise EngineError(f"engine {self.engine.path} played an invalid move: {move_idx}")
+        return move_idx
+
+    def get_name(self) -> str:
+        return self.engine.get_name()
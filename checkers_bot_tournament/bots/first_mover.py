@@ -9,6 +9,8 @@ class FirstMover(Bot):
     Just picks the first move :D
     """
 
+    deterministic = True
+
     def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
         return 0
 
@@ -11,6 +11,8 @@ class GreedyCat(Bot):
     Maximise my material after 3 layers of search
     """
 
+    deterministic = True
+
     def __init__(self, bot_id: int) -> None:
         super().__init__(bot_id)
         self.ply = 1
@@ -20,6 +22,10 @@ class GreedyCat(Bot):
 
     def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
         # print(f"Ply {self.ply if colour == Colour.WHITE else self.ply + 1} as {colour}")
+        book_move = self.probe_book(board, colour, move_list)
+        if book_move is not None:
+            return book_move
+
         opp_colour = Colour.BLACK if colour == Colour.WHITE else Colour.WHITE
 
         scores1: list[tuple[int, int]] = []
@@ -90,24 +96,12 @@ class GreedyCat(Bot):
                 else:
                     return len(board.get_move_list(colour_to_move))
 
-        # Determine the letter representing the opponent's pieces
-        opp_colour = our_colour.get_opposite()
-
-        # Calculate the material count for the player's pieces
-        material_score = 0
-        for i in board.grid:
-            for j in i:
-                if j:
-                    if j.colour is our_colour:
-                        if j.is_king:
-                            self.king_value += self.king_value
-                        else:
-                            material_score += self.man_value
-                    elif j.colour is opp_colour:
-                        if j.is_king:
-                            self.king_value -= self.king_value
-                        else:
-                            material_score -= self.man_value
+        our_men, _ = board.count_pieces(our_colour)
+        opp_men, _ = board.count_pieces(our_colour.get_opposite())
+
+        # Calculate the material count: kings have never counted towards it (king_value
+        # isn't used), which is kept so that GreedyCat keeps playing the same moves
+        material_score = self.man_value * (our_men - opp_men)
 
         # Return the difference in material count
         return material_score
@@ -0,0 +1,208 @@
+import copy
+import multiprocessing
+import random
+import struct
+import time
+from array import array
+from multiprocessing.connection import Connection
+from typing import Optional
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.board_start_builder import board_start_builder_mapping
+from checkers_bot_tournament.bot_registry import load_bot_class
+from checkers_bot_tournament.bots.base_bot import Bot
+from checkers_bot_tournament.engine import EngineError
+from checkers_bot_tournament.move import Move
+from checkers_bot_tournament.opening_book import OpeningBook, decode_move, encode_move
+from checkers_bot_tournament.piece import Colour
+
+# new game flag, colour to move (0 white, 1 black), then for a new game the state of the
+# bot's random number generator as uint32s, then the moves played since the last request as
+# uint16s (see encode_move)
+REQUEST = struct.Struct("<BB")
+NEW_GAME = 1
+RNG_STATE_SIZE = 625 * 4
+# ok, chosen move index, nanoseconds the bot spent on it
+REPLY = struct.Struct("<?hQ")
+
+
+def _host_bot(
+    conn: Connection,
+    bot_spec: str,
+    bot_id: int,
+    opening_book: Optional[OpeningBook],
+    board_start_builder: str,
+    size: int,
+) -> None:
+    """
+    Runs in the bot's process. Keeps a mirror of the board of the game being played, kept
+    in sync with only the moves played since the bot last moved.
+    """
+    bot = load_bot_class(bot_spec)(bot_id=bot_id)
+    bot.opening_book = opening_book
+    builder = board_start_builder_mapping[board_start_builder](size)
+    conn.send_bytes(bot.get_name().encode())
+
+    board = Board(builder, size)
+    while True:
+        try:
+            request = conn.recv_bytes()
+        except EOFError:
+            break
+        if not request:
+            break
+
+        flags, colour_code = REQUEST.unpack_from(request)
+        moves_start = REQUEST.size
+        if flags & NEW_GAME:
+            board = Board(builder, size)
+            rng_state = array("I", request[moves_start : moves_start + RNG_STATE_SIZE])
+            bot.rng.setstate((random.Random.VERSION, tuple(rng_state), None))
+            moves_start += RNG_STATE_SIZE
+        for code in array("H", request[moves_start:]):
+            board.move_piece(decode_move(code, size))
+
+        colour = Colour.WHITE if colour_code == 0 else Colour.BLACK
+        move_list = board.get_move_list(colour)
+        start = time.perf_counter_ns()
+        try:
+            move_idx = bot.play_move(copy.deepcopy(board), colour, copy.copy(move_list))
+        except Exception as e:
+            conn.send_bytes(REPLY.pack(False, -1, 0) + repr(e).encode())
+            continue
+        think_ns = time.perf_counter_ns() - start
+
+        if 0 <= move_idx < len(move_list):
+            board.move_piece(move_list[move_idx])
+        conn.send_bytes(REPLY.pack(True, move_idx, think_ns))
+
+
+class IsolatedBot(Bot):
+    """
+    Runs a bot in its own long-lived process, so that it is set up once for the whole
+    tournament and can't affect the tournament process or other bots. A bot that raises or
+    whose process dies forfeits the game, and the process is restarted for its next game.
+
+    Round trip and think times are kept, their difference is the per-move overhead of
+    running the bot out of process.
+    """
+
+    isolated = True
+
+    def __init__(
+        self,
+        bot_id: int,
+        bot_spec: str,
+        opening_book: Optional[OpeningBook],
+        board_start_builder: str,
+        size: int,
+        deterministic: bool = False,
+    ) -> None:
+        super().__init__(bot_id)
+        self.bot_spec = bot_spec
+        # The hosted bot's, it isn't imported here
+        self.deterministic = deterministic
+        self.host_args = (bot_spec, bot_id, opening_book, board_start_builder, size)
+        self.name: Optional[str] = None
+        # Whether the current process has sent its name, i.e. finished setting up
+        self.ready = False
+        self.conn: Optional[Connection] = None
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        # Moves of the current game the bot's process already has
+        self.synced = 0
+        self.new_game = True
+
+        self.moves = 0
+        self.round_trip_ns = 0
+        self.think_ns = 0
+
+        self._start_process()
+
+    def _start_process(self) -> None:
+        self.ready = False
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_host_bot, args=(child_conn, *self.host_args), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def _connection(self) -> Connection:
+        assert self.conn is not None
+        if not self.ready:
+            # The bot's process sends its name once it is set up
+            try:
+                self.name = self.conn.recv_bytes().decode()
+                self.ready = True
+            except EOFError as e:
+                raise EngineError(f"{self.bot_spec} process failed to start") from e
+        return self.conn
+
+    def start_game(self, game_id: int) -> None:
+        if self.process is None or not self.process.is_alive():
+            self.close()
+            self._start_process()
+        self.synced = 0
+        self.new_game = True
+
+    def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
+        conn = self._connection()
+        start = time.perf_counter_ns()
+        history = board.get_move_history()
+        request = REQUEST.pack(NEW_GAME if self.new_game else 0, colour != Colour.WHITE)
+        if self.new_game:
+            # The bot's process continues from the rng the game gave this bot
+            request += array("I", self.rng.getstate()[1]).tobytes()
+        moves = array("H", (encode_move(move, board.size) for move in history[self.synced :]))
+        request += moves.tobytes()
+        try:
+            conn.send_bytes(request)
+            reply = conn.recv_bytes()
+        except (EOFError, OSError) as e:
+            raise EngineError(f"{self.get_name()} process exited") from e
+        self.round_trip_ns += time.perf_counter_ns() - start
+
+        ok, move_idx, think_ns = REPLY.unpack_from(reply)
+        if not ok:
+            raise EngineError(f"{self.get_name()} raised {reply[REPLY.size :].decode()}")
+        if move_idx < 0 or move_idx >= len(move_list):
+            raise EngineError(f"{self.get_name()} played an invalid move: {move_idx}")
+
+        # The bot's process has played its move on its board too
+        self.synced = len(history) + 1
+        self.new_game = False
+        self.moves += 1
+        self.think_ns += think_ns
+        return move_idx
+
+    @property
+    def overhead_us(self) -> float:
+        """Mean time per move spent outside the bot's play_move, in microseconds."""
+        if self.moves == 0:
+            return 0.0
+        return (self.round_trip_ns - self.think_ns) / self.moves / 1000
+
+    def get_name(self) -> str:
+        if self.name is None:
+            try:
+                self._connection()
+            except EngineError:
+                # Never started, still needs a name for the results
+                return self.bot_spec.rpartition(":")[2]
+        assert self.name is not None
+        return self.name
+
+    def close(self) -> None:
+        if self.conn is not None:
+            try:
+                self.conn.send_bytes(b"")
+            except OSError:
+                pass
+            self.conn.close()
+            self.conn = None
+        if self.process is not None:
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                self.process.kill()
+            self.process = None
@@ -1,5 +1,3 @@
-from random import randint
-
 from checkers_bot_tournament.board import Board
 from checkers_bot_tournament.bots.base_bot import Bot
 from checkers_bot_tournament.move import Move
@@ -8,7 +6,7 @@ from checkers_bot_tournament.piece import Colour
 
 class RandomBot(Bot):
     def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
-        return randint(0, len(move_list) - 1)
+        return self.rng.randrange(len(move_list))
 
     def get_name(self) -> str:
         return "RandomBot"
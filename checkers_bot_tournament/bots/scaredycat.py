@@ -11,7 +11,13 @@ class ScaredyCat(Bot):
     Maximise the length of my opponent's move list (unless I can win)
     """
 
+    deterministic = True
+
     def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
+        book_move = self.probe_book(board, colour, move_list)
+        if book_move is not None:
+            return book_move
+
         opp_colour = Colour.BLACK if colour == Colour.WHITE else Colour.WHITE
 
         scores1: list[tuple[int, int]] = []
@@ -2,7 +2,8 @@ from math import inf, log10
 from typing import overload
 
 from checkers_bot_tournament.bots.base_bot import Bot
-from checkers_bot_tournament.bots.bot_tracker import BotTracker, EloConfig
+from checkers_bot_tournament.bots.bot_tracker import BotTracker
+from checkers_bot_tournament.elo import EloConfig
 
 
 @overload
@@ -0,0 +1,34 @@
+import json
+import os
+from typing import Any
+
+import numpy as np
+
+CHECKPOINT_FILE = "checkpoint.npz"
+
+
+def write_checkpoint(folder: str, metadata: dict[str, Any], arrays: dict[str, np.ndarray]) -> None:
+    """
+    Atomically writes a checkpoint into a results folder: the JSON-able metadata and the
+    arrays go into one compressed .npz, written to a temporary file that then replaces the
+    previous checkpoint, so a crash mid-write never leaves a broken checkpoint behind.
+    """
+    path = os.path.join(folder, CHECKPOINT_FILE)
+    tmp_path = path + ".tmp"
+    contents: dict[str, Any] = {"metadata": np.array(json.dumps(metadata)), **arrays}
+    with open(tmp_path, "wb") as file:
+        np.savez_compressed(file, **contents)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(folder: str) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    path = os.path.join(folder, CHECKPOINT_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"no {CHECKPOINT_FILE} in {folder}, nothing to resume")
+
+    with np.load(path, allow_pickle=False) as data:
+        metadata = json.loads(str(data["metadata"]))
+        arrays = {name: data[name] for name in data.files if name != "metadata"}
+    return metadata, arrays
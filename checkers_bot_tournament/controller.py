@@ -1,57 +1,48 @@
+import asyncio
 import os
-from dataclasses import dataclass
+import random
+from dataclasses import asdict, replace
 from datetime import datetime
 from typing import IO, Dict, Optional, Type
 
+import numpy as np
+
 from checkers_bot_tournament.board import Board
 from checkers_bot_tournament.board_start_builder import (
     BoardStartBuilder,
-    DefaultBSB,
-    LastRowBSB,
+    board_start_builder_mapping,
 )
-
-# BOT TODO: Import your bot here!
+from checkers_bot_tournament.bot_registry import BotRegistry, class_spec
 from checkers_bot_tournament.bots.base_bot import Bot
-from checkers_bot_tournament.bots.bot_tracker import BotTracker
-from checkers_bot_tournament.bots.copycat import CopyCat
-from checkers_bot_tournament.bots.first_mover import FirstMover
-from checkers_bot_tournament.bots.greedycat import GreedyCat
-from checkers_bot_tournament.bots.random_bot import RandomBot
-from checkers_bot_tournament.bots.scaredycat import ScaredyCat
-from checkers_bot_tournament.checkers_util import make_unique_bot_string
+from checkers_bot_tournament.bots.bot_tracker import RESULT_CODES, BotTracker, H2HMatrix
+from checkers_bot_tournament.bots.external_bot import ExternalBot
+from checkers_bot_tournament.bots.isolated_bot import IsolatedBot
+from checkers_bot_tournament.distributed import (
+    Coordinator,
+    WorkerConfig,
+    parse_address,
+    task_from_game,
+)
+from checkers_bot_tournament.elo import EloRatings
+from checkers_bot_tournament.engine import EnginePool
 from checkers_bot_tournament.game import Game
 from checkers_bot_tournament.game_result import GameResult
+from checkers_bot_tournament.checkers_util import make_unique_bot_string
+from checkers_bot_tournament.checkpoint import read_checkpoint, write_checkpoint
+from checkers_bot_tournament.opening_book import OpeningBook
+from checkers_bot_tournament.ratings_db import RatingsDB
+from checkers_bot_tournament.sprt import SPRTConfig, SPRTResult, sprt_status
+from checkers_bot_tournament.swiss import swiss_pairings
 from checkers_bot_tournament.stat_printing import (
+    write_tournament_bt_stats,
     write_tournament_h2h_stats,
     write_tournament_overall_stats,
+    write_tournament_sprt_stats,
 )
 
 
-@dataclass
-class GameResultStat:
-    white_wins: int = 0
-    white_draws: int = 0
-    white_losses: int = 0
-
-    black_wins: int = 0
-    black_draws: int = 0
-    black_losses: int = 0
-
-
 class Controller:
-    # BOT TODO: Add your bot mapping here!
-    bot_mapping: Dict[str, Type[Bot]] = {
-        "RandomBot": RandomBot,
-        "FirstMover": FirstMover,
-        "ScaredyCat": ScaredyCat,
-        "GreedyCat": GreedyCat,
-        "CopyCat": CopyCat,
-    }
-
-    board_start_builder_mapping: Dict[str, Type[BoardStartBuilder]] = {
-        "default": DefaultBSB,
-        "last_row": LastRowBSB,
-    }
+    board_start_builder_mapping: Dict[str, Type[BoardStartBuilder]] = board_start_builder_mapping
 
     def __init__(
         self,
@@ -65,128 +56,244 @@ class Controller:
         verbose: bool,
         output_dir: str,
         export_pdn: bool,
+        book: Optional[str] = None,
+        rating_model: str = "elo",
+        sprt: Optional[SPRTConfig] = None,
+        pairing: str = "round-robin",
+        ratings_db: Optional[str] = None,
+        serve: Optional[str] = None,
+        engine_processes: Optional[int] = None,
+        isolate_bots: bool = False,
+        bot_dirs: Optional[list[str]] = None,
+        seed: Optional[int] = None,
     ):
         self.mode = mode
 
         # NOTE: size currently not used
         self.size = size
+        self.board_start_builder_name = board_start_builder
         self.board_start_builder: BoardStartBuilder = self._get_board_start_builder(
             board_start_builder
         )
 
         self.pdn = pdn
+        # Every game's bots get random number generators derived from this and the game id
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
         self.bot_name = bot_name
-
+        self.bot_names = bot_names
+        self.book = book
+        self.opening_book: Optional[OpeningBook] = OpeningBook.load(book) if book else None
+
+        self.bot_dirs = bot_dirs
+        # Bots are looked up here and only imported once they are needed
+        self.registry = BotRegistry(bot_dirs)
+        self.engine_processes = engine_processes
+        self.isolate_bots = isolate_bots
+        self.engines: dict[str, EnginePool] = {}
+
+        # One row per bot, plus one for the hero bot in one mode
+        num_trackers = len(bot_names) + (1 if mode == "one" else 0)
+        self.h2h = H2HMatrix(num_trackers)
+        self.elo = EloRatings(num_trackers)
         self.bot_list: list[BotTracker] = self._init_bots(bot_names)
 
         self.rounds = rounds
         self.verbose = verbose
         self.output_dir = output_dir
         self.export_pdn = export_pdn
+        self.rating_model = rating_model
+        self.sprt = sprt
+        self.pairing = pairing
+        self.ratings_db_path = ratings_db
+        self.ratings_db: Optional[RatingsDB] = RatingsDB(ratings_db) if ratings_db else None
+        self.serve = serve
+        self.coordinator: Optional[Coordinator] = None
 
         # Inits for non-params
-        # List of rounds, each round being a list of games
+        # List of rounds, each round being a list of games. Rounds are scheduled as they
+        # start, so that scheduling can depend on the results so far.
         self.games: list[list[Game]] = [[] for _ in range(rounds)]
         self.game_results: list[list[GameResult]] = [[] for _ in range(rounds)]
         self.game_id_counter: int = 0
         self.game_results_folder: Optional[str] = None
+        self.hero_bot: Optional[BotTracker] = None
+        # SPRT decision against each opponent (by index) in one mode
+        self.sprt_results: dict[int, SPRTResult] = {}
+        # Number of byes each bot has had with swiss pairing
+        self.byes = np.zeros(num_trackers, dtype=np.int64)
+        # First round to play, later than 0 when resuming from a checkpoint
+        self.start_round = 0
+        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Results of games between deterministic bots, see _memo_key
+        self.result_cache: dict[tuple, GameResult] = {}
 
         self._init_game_schedule()
+        if serve:
+            if self.engines:
+                raise ValueError("engine bots can't be played by workers with --serve")
+            if self.isolate_bots:
+                raise ValueError("--isolate-bots has no effect with --serve, workers run the bots")
+            self.coordinator = self._init_coordinator(serve)
+        if self.ratings_db is not None:
+            self._load_ratings(self.ratings_db)
 
     def _init_bots(self, bot_names: list[str]) -> list[BotTracker]:
         unrecognised_bots = []
         bot_list: list[BotTracker] = []
         for bot in bot_names:
-            if bot not in Controller.bot_mapping:
+            if bot not in self.registry and not self._is_engine(bot):
                 unrecognised_bots.append(bot)
 
         if unrecognised_bots:
             raise ValueError(f"bots: {', '.join(unrecognised_bots)} entered in CLI not recognised!")
 
-        idx_bot_names: list[tuple[int, str]] = [
-            (
-                idx,
-                bot_name,
-            )
-            for idx, bot_name in enumerate(bot_names)
-        ]
-        unique_bot_names = list(map(lambda x: make_unique_bot_string(x[0], x[1]), idx_bot_names))
-        for idx, bot_name in idx_bot_names:
-            bot_class = self.bot_mapping[bot_name]
-            bot_list.append(
-                BotTracker(bot=bot_class(bot_id=idx), unique_bot_names=unique_bot_names)
-            )
+        for idx, bot_name in enumerate(bot_names):
+            new_bot = self._make_bot(bot_name, idx)
+            bot_list.append(BotTracker(bot=new_bot, h2h=self.h2h, elo=self.elo, index=idx))
 
         return bot_list
 
+    @staticmethod
+    def _is_engine(bot_name: str) -> bool:
+        """Bots given as a path to an executable run as engines (see engine.py)."""
+        return os.path.isfile(bot_name) and os.access(bot_name, os.X_OK)
+
+    def _make_bot(self, bot_name: str, bot_id: int) -> Bot:
+        new_bot: Bot
+        if bot_name in self.registry and self.isolate_bots:
+            bot_class = self.registry.load(bot_name)
+            return IsolatedBot(
+                bot_id,
+                class_spec(bot_class),
+                self.opening_book,
+                self.board_start_builder_name,
+                self.size,
+                bot_class.deterministic,
+            )
+        elif bot_name in self.registry:
+            new_bot = self.registry.load(bot_name)(bot_id=bot_id)
+        else:
+            # Every instance of an engine shares its processes
+            if bot_name not in self.engines:
+                self.engines[bot_name] = EnginePool(bot_name, self.engine_processes)
+            new_bot = ExternalBot(bot_id, self.engines[bot_name])
+        new_bot.opening_book = self.opening_book
+        return new_bot
+
     def _init_game_schedule(self) -> None:
         match self.mode:
             case "all":
                 assert self.bot_name is None, "--player should not be set if running on all mode"
-                self._init_all_schedule()
+                assert self.sprt is None, "--sprt is only supported in one mode"
+                match self.pairing:
+                    case "round-robin":
+                        games_per_round = len(self.bot_list) * (len(self.bot_list) - 1)
+                    case "swiss":
+                        games_per_round = len(self.bot_list) // 2
+                    case _:
+                        raise ValueError(f"pairing value {self.pairing} not recognised!")
             case "one":
                 assert self.bot_name, "--player must be set in one mode"
-                try:
-                    # Special case: we set the bot id to -1 since the list starts at 0
-                    # kinda hacky but uh :D
-                    unique_bot_names = list(map(lambda x: make_unique_bot_string(x), self.bot_list))
-                    bot_class = self.bot_mapping[self.bot_name]
-                    hero_bot = BotTracker(
-                        bot=bot_class(bot_id=-1), unique_bot_names=unique_bot_names
-                    )
-                except KeyError:
+                if self.bot_name not in self.registry and not self._is_engine(self.bot_name):
                     raise ValueError(f"bot name {self.bot_name} entered in CLI not recognised!")
-                self._init_one_schedule(hero_bot)
+                # Special case: we set the bot id to -1 since the list starts at 0
+                # kinda hacky but uh :D
+                bot = self._make_bot(self.bot_name, -1)
+                # The hero takes the last row of the h2h matrix
+                self.hero_bot = BotTracker(
+                    bot=bot, h2h=self.h2h, elo=self.elo, index=len(self.bot_list)
+                )
+                self.sprt_results = {bot.index: SPRTResult.UNDECIDED for bot in self.bot_list}
+                games_per_round = 2 * len(self.bot_list)
             case _:
                 raise ValueError(f"mode value {self.mode} not recognised!")
 
         if self.verbose:
-            games_per_round = len(self.games[0])
-            total = len(self.games[0]) * self.rounds
+            total = games_per_round * self.rounds
+            up_to = "up to " if self.sprt else ""
+            schedule = "swiss" if self.pairing == "swiss" else "double-round-robin"
             print(f"{len(self.bot_list)} bots registered")
             print(
-                f"{games_per_round} double-round-robin games/tourney * {self.rounds} tourneys = {total} games scheduled"
+                f"{games_per_round} {schedule} games/tourney * {self.rounds} tourneys = {up_to}{total} games scheduled"
             )
 
-    def _init_all_schedule(self) -> None:
+    def _schedule_round(self, rnd: int) -> None:
+        match self.mode:
+            case "all" if self.pairing == "swiss":
+                self._schedule_swiss_round(rnd)
+            case "all":
+                self._schedule_all_round(rnd)
+            case "one":
+                assert self.hero_bot is not None
+                self._schedule_one_round(self.hero_bot, rnd)
+
+    def _schedule_all_round(self, rnd: int) -> None:
         """
         Schedules all bots against each other, where each pairing plays as both sides in each round
         """
-        for rnd in range(self.rounds):
-            for id1, bot1 in enumerate(self.bot_list):
-                for id2, bot2 in enumerate(self.bot_list):
-                    if id1 < id2:
-                        self._schedule_pair_game(bot1, bot2, rnd)
+        for id1, bot1 in enumerate(self.bot_list):
+            for id2, bot2 in enumerate(self.bot_list):
+                if id1 < id2:
+                    self._schedule_pair_game(bot1, bot2, rnd)
+
+    def _schedule_swiss_round(self, rnd: int) -> None:
+        """
+        Schedules one game per swiss pairing, computed from the results and ratings after
+        the previous round
+        """
+        pairings, bye = swiss_pairings(
+            [bot.index for bot in self.bot_list], self.h2h, self.elo.ratings, self.byes, rnd
+        )
+        if bye is not None:
+            self.byes[bye] += 1
+        for white, black in pairings:
+            self._schedule_game(self.bot_list[white], self.bot_list[black], rnd)
 
-    def _init_one_schedule(self, hero_bot: BotTracker) -> None:
+    def _schedule_one_round(self, hero_bot: BotTracker, rnd: int) -> None:
         """
-        Runs the one bot against all bots in the bot list
+        Runs the one bot against all bots in the bot list, skipping opponents the SPRT has
+        already decided on
         """
-        for rnd in range(self.rounds):
-            for id2, other in enumerate(self.bot_list):
+        for other in self.bot_list:
+            if self.sprt_results[other.index] == SPRTResult.UNDECIDED:
                 self._schedule_pair_game(hero_bot, other, rnd)
 
+    def _update_sprt(self, rnd: int) -> None:
+        """
+        Runs the SPRT for every opponent still undecided, using the hero's h2h results so
+        far. Decided opponents are not scheduled again, so the remaining rounds only go to
+        close matchups.
+        """
+        assert self.sprt is not None and self.hero_bot is not None
+        for other in self.bot_list:
+            if self.sprt_results[other.index] != SPRTResult.UNDECIDED:
+                continue
+            stat = self.hero_bot.h2h_stat(other)
+            result = sprt_status(stat.total_wins, stat.total_draws, stat.total_losses, self.sprt)
+            self.sprt_results[other.index] = result
+            if self.verbose and result != SPRTResult.UNDECIDED:
+                print(
+                    f"SPRT: {make_unique_bot_string(self.hero_bot)} {result.name.lower()} than "
+                    f"{make_unique_bot_string(other)} after {stat.total_games} games "
+                    f"(round {rnd})"
+                )
+
     def _schedule_pair_game(self, bot1: BotTracker, bot2: BotTracker, rnd: int) -> None:
-        new_game1 = Game(
-            bot1,
-            bot2,
-            Board(self.board_start_builder),
-            self._get_new_game_id(),
-            rnd,
-            self.verbose,
-            self.pdn,
-        )
-        new_game2 = Game(
-            bot2,
-            bot1,
+        self._schedule_game(bot1, bot2, rnd)
+        self._schedule_game(bot2, bot1, rnd)
+
+    def _schedule_game(self, white: BotTracker, black: BotTracker, rnd: int) -> None:
+        new_game = Game(
+            white,
+            black,
             Board(self.board_start_builder),
             self._get_new_game_id(),
             rnd,
             self.verbose,
             self.pdn,
+            self.seed,
         )
-        self.games[rnd].append(new_game1)
-        self.games[rnd].append(new_game2)
+        self.games[rnd].append(new_game)
 
     def _get_new_game_id(self) -> int:
         self.game_id_counter += 1
@@ -209,35 +316,77 @@ class Controller:
         os.makedirs(folder_path, exist_ok=True)
         self.game_results_folder = folder_path
 
+    def _init_coordinator(self, serve: str) -> Coordinator:
+        pdn_content = None
+        if self.pdn:
+            with open(self.pdn, "r", encoding="utf-8") as file:
+                pdn_content = file.read().strip()
+        config = WorkerConfig(
+            board_start_builder=self.board_start_builder_name,
+            size=self.size,
+            pdn=pdn_content,
+            verbose=self.verbose,
+            opening_book=self.opening_book,
+            seed=self.seed,
+        )
+        coordinator = Coordinator(parse_address(serve), config, verbose=self.verbose)
+        if self.verbose:
+            host, port = coordinator.address
+            print(f"Serving games to workers on {host}:{port}")
+        return coordinator
+
+    def _all_trackers(self) -> list[BotTracker]:
+        return self.bot_list + ([self.hero_bot] if self.hero_bot is not None else [])
+
+    def _load_ratings(self, ratings_db: RatingsDB) -> None:
+        """Starts every bot from its stored rating and game count, if it has played before."""
+        trackers = self._all_trackers()
+        stored = ratings_db.load(tracker.bot.get_name() for tracker in trackers)
+        for tracker in trackers:
+            name = tracker.bot.get_name()
+            if name in stored:
+                rating, games_played = stored[name]
+                self.elo.ratings[tracker.index] = rating
+                self.elo.games_played[tracker.index] = games_played
+        if self.verbose:
+            print(f"Loaded stored ratings for {len(stored)} bots")
+
     ###################################
     #  ^^^ Initialising functions ^^^ #
     ###################################
 
     def run(self) -> None:
-        self._create_timestamped_folder()
-        for rnd in range(self.rounds):
-            for game in self.games[rnd]:
-                ev_white = game.white.calculate_ev(game.black)
-                ev_black = 1 - ev_white
-
-                # Sum of EV score for each player
-                # based on all games they will play in this tournaments
-                game.white.register_ev(ev_white)
-                game.black.register_ev(ev_black)
-
-            for game in self.games[rnd]:
-                game_result = game.run()
-                self.game_results[rnd].append(game_result)
-
+        if self.game_results_folder is None:
+            self._create_timestamped_folder()
+        if self.verbose:
+            print(f"Seed: {self.seed}")
+        for rnd in range(self.start_round, self.rounds):
+            self._schedule_round(rnd)
+            if not self.games[rnd]:
+                if self.verbose:
+                    print(f"No games left to schedule, stopping after {rnd} rounds")
+                break
+
+            self.game_results[rnd].extend(self._play_round(self.games[rnd]))
             self._write_game_results(self.game_results[rnd])
 
             # Calculate Elo at the end of all matches in a round
-            for game, game_result in zip(self.games[rnd], self.game_results[rnd]):
-                game.white.register_game_result(game_result)
-                game.black.register_game_result(game_result)
+            white = np.array([game.white.index for game in self.games[rnd]], dtype=np.intp)
+            black = np.array([game.black.index for game in self.games[rnd]], dtype=np.intp)
+            codes = np.array(
+                [RESULT_CODES[game_result.result] for game_result in self.game_results[rnd]],
+                dtype=np.intp,
+            )
+            self.h2h.register_results(white, black, codes)
+            self.elo.rate_round(white, black, codes)
+
+            if self.sprt is not None:
+                self._update_sprt(rnd)
 
-            for bot in self.bot_list:
-                bot.update_rating()
+            if self.ratings_db is not None:
+                self._record_round(self.ratings_db, rnd, white, black)
+
+            self._write_checkpoint(rnd + 1)
 
             if self.verbose:
                 print(f"Round {rnd} completed")
@@ -245,6 +394,211 @@ class Controller:
         if self.verbose:
             print("Tournament completed, writing stats")
         self._write_tournament_results()
+        if self.coordinator is not None:
+            self.coordinator.close()
+        if self.event_loop is not None:
+            self.event_loop.run_until_complete(self._close_engines())
+            self.event_loop.close()
+        self._close_isolated_bots()
+        if self.ratings_db is not None:
+            self.ratings_db.close()
+
+    def _play_round(self, games: list[Game]) -> list[GameResult]:
+        """
+        Plays a round's games, except pairings of deterministic bots that have been played
+        before (in this round or an earlier one), whose result is reused.
+        """
+        keys = [self._memo_key(game) for game in games]
+        to_play: list[Game] = []
+        playing: set[tuple] = set()
+        for game, key in zip(games, keys):
+            if key is None:
+                to_play.append(game)
+            elif key not in self.result_cache and key not in playing:
+                playing.add(key)
+                to_play.append(game)
+
+        played = {
+            game.game_id: game_result
+            for game, game_result in zip(to_play, self._play_games(to_play))
+        }
+        game_results: list[GameResult] = []
+        for game, key in zip(games, keys):
+            if game.game_id in played:
+                game_result = played[game.game_id]
+                if key is not None:
+                    self.result_cache[key] = game_result
+            else:
+                assert key is not None
+                game_result = self._reuse_result(game, self.result_cache[key])
+            game_results.append(game_result)
+
+        if self.verbose and len(to_play) < len(games):
+            print(f"Reused {len(games) - len(to_play)} results of deterministic pairings")
+        return game_results
+
+    def _play_games(self, games: list[Game]) -> list[GameResult]:
+        if not games:
+            return []
+        if self.coordinator is not None:
+            return self.coordinator.run_games([task_from_game(game) for game in games])
+        if self.engines:
+            return self._get_event_loop().run_until_complete(self._run_games_async(games))
+        return [game.run() for game in games]
+
+    def _memo_key(self, game: Game) -> Optional[tuple]:
+        """Identifies the game to be played if both bots are deterministic, else None."""
+        bot_specs = []
+        for tracker in (game.white, game.black):
+            bot = tracker.bot
+            if not bot.deterministic:
+                return None
+            bot_specs.append(
+                bot.bot_spec if isinstance(bot, IsolatedBot) else class_spec(type(bot))
+            )
+        return (*bot_specs, self.board_start_builder_name, self.size, self.pdn)
+
+    @staticmethod
+    def _reuse_result(game: Game, game_result: GameResult) -> GameResult:
+        """The result of an identical game, with this game's ids, bots and ratings."""
+        return replace(
+            game_result,
+            game_id=game.game_id,
+            game_round=game.game_round,
+            white_name=make_unique_bot_string(game.white),
+            white_rating=round(game.white.rating),
+            black_name=make_unique_bot_string(game.black),
+            black_rating=round(game.black.rating),
+        )
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        # One loop for the whole tournament, so engine processes live across rounds
+        if self.event_loop is None:
+            self.event_loop = asyncio.new_event_loop()
+        return self.event_loop
+
+    @staticmethod
+    async def _run_games_async(games: list[Game]) -> list[GameResult]:
+        """Plays a round's games concurrently, while engines think other games move on."""
+        return list(await asyncio.gather(*(game.run_async() for game in games)))
+
+    def _close_isolated_bots(self) -> None:
+        for tracker in self._all_trackers():
+            if isinstance(tracker.bot, IsolatedBot):
+                if self.verbose:
+                    print(
+                        f"{make_unique_bot_string(tracker)}: {tracker.bot.moves} moves, "
+                        f"{tracker.bot.overhead_us:.1f}us overhead per move"
+                    )
+                tracker.bot.close()
+
+    async def _close_engines(self) -> None:
+        await asyncio.gather(*(engine.close() for engine in self.engines.values()))
+
+    def _record_round(
+        self, ratings_db: RatingsDB, rnd: int, white: np.ndarray, black: np.ndarray
+    ) -> None:
+        """
+        Stores a finished round in the ratings database. Instances of the same bot share a
+        row there, so their ratings are averaged and their games added up.
+        """
+        assert self.game_results_folder is not None
+        trackers = self._all_trackers()
+        round_games = np.bincount(np.concatenate([white, black]), minlength=len(trackers))
+
+        instances: dict[str, list[int]] = {}
+        for tracker in trackers:
+            if round_games[tracker.index]:
+                instances.setdefault(tracker.bot.get_name(), []).append(tracker.index)
+        ratings = {
+            name: (float(self.elo.ratings[idx].mean()), int(round_games[idx].sum()))
+            for name, idx in instances.items()
+        }
+
+        games = [
+            (
+                game_result.game_id,
+                game.white.bot.get_name(),
+                game.black.bot.get_name(),
+                game_result.result.name,
+            )
+            for game, game_result in zip(self.games[rnd], self.game_results[rnd])
+        ]
+        run = os.path.basename(os.path.normpath(self.game_results_folder))
+        ratings_db.record_round(run, rnd, games, ratings)
+
+    def _write_checkpoint(self, next_round: int) -> None:
+        """
+        Saves everything needed to continue from next_round into the results folder. Game
+        ids are handed out in order, so the last id is enough to know which games finished.
+        """
+        assert self.game_results_folder is not None
+        summary_path = os.path.join(self.game_results_folder, "game_result_summary.txt")
+        metadata = {
+            "config": {
+                "mode": self.mode,
+                "board_start_builder": self.board_start_builder_name,
+                "pdn": self.pdn,
+                "bot_name": self.bot_name,
+                "bot_names": self.bot_names,
+                "size": self.size,
+                "rounds": self.rounds,
+                "verbose": self.verbose,
+                "output_dir": self.output_dir,
+                "export_pdn": self.export_pdn,
+                "book": self.book,
+                "rating_model": self.rating_model,
+                "sprt": asdict(self.sprt) if self.sprt is not None else None,
+                "pairing": self.pairing,
+                "ratings_db": self.ratings_db_path,
+                "serve": self.serve,
+                "engine_processes": self.engine_processes,
+                "isolate_bots": self.isolate_bots,
+                "bot_dirs": self.bot_dirs,
+                "seed": self.seed,
+            },
+            "next_round": next_round,
+            "last_game_id": self.game_id_counter,
+            # Anything past this was written after the checkpoint and is dropped on resume
+            "summary_size": os.path.getsize(summary_path) if os.path.exists(summary_path) else 0,
+            "sprt_results": {str(idx): result.name for idx, result in self.sprt_results.items()},
+        }
+        arrays = {
+            "h2h_counts": self.h2h.counts,
+            "ratings": self.elo.ratings,
+            "games_played": self.elo.games_played,
+            "byes": self.byes,
+        }
+        write_checkpoint(self.game_results_folder, metadata, arrays)
+
+    @classmethod
+    def resume(cls, folder: str) -> "Controller":
+        """Recreates a Controller from the checkpoint in a results folder, ready to run()."""
+        metadata, arrays = read_checkpoint(folder)
+        config = metadata["config"]
+        sprt = SPRTConfig(**config["sprt"]) if config["sprt"] is not None else None
+        controller = cls(**{**config, "sprt": sprt})
+
+        controller.h2h.counts[...] = arrays["h2h_counts"]
+        # The checkpoint has the ratings as of this run, not whatever is in the database now
+        controller.elo.ratings[...] = arrays["ratings"]
+        controller.elo.games_played[...] = arrays["games_played"]
+        controller.byes[...] = arrays["byes"]
+        controller.sprt_results = {
+            int(idx): SPRTResult[name] for idx, name in metadata["sprt_results"].items()
+        }
+        controller.game_id_counter = metadata["last_game_id"]
+        controller.start_round = metadata["next_round"]
+
+        controller.game_results_folder = folder
+        summary_path = os.path.join(folder, "game_result_summary.txt")
+        if os.path.exists(summary_path):
+            with open(summary_path, "r+", encoding="utf-8") as file:
+                file.truncate(metadata["summary_size"])
+
+        if controller.verbose:
+            print(f"Resuming {folder} from round {controller.start_round}")
+        return controller
 
     def _write_game_result_summary(self, file: IO, game_result: GameResult) -> None:
         file.write(str(game_result))
@@ -267,7 +621,7 @@ class Controller:
 
                 if self.export_pdn:
                     game_result_pdn_path = os.path.join(
-                        self.game_results_folder, f"game_{game_result}.pdn"
+                        self.game_results_folder, f"game_{game_result.game_id}.pdn"
                     )
                     with open(game_result_pdn_path, "w") as pdn_file:
                         pdn_file.write(game_result.moves_pdn)
@@ -279,3 +633,10 @@ class Controller:
         with open(game_result_stats_path, "w", encoding="utf-8") as file:
             write_tournament_overall_stats(self.bot_list, file)
             write_tournament_h2h_stats(self.bot_list, file)
+            if self.rating_model == "bradley-terry":
+                write_tournament_bt_stats(self.bot_list, file)
+            if self.sprt is not None:
+                assert self.hero_bot is not None
+                write_tournament_sprt_stats(
+                    self.hero_bot, self.bot_list, self.sprt_results, self.sprt, file
+                )
@@ -0,0 +1,241 @@
+import argparse
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Optional
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.board_start_builder import board_start_builder_mapping
+from checkers_bot_tournament.bot_registry import class_spec, load_bot_class
+from checkers_bot_tournament.bots.base_bot import Bot
+from checkers_bot_tournament.bots.bot_tracker import BotTracker, H2HMatrix
+from checkers_bot_tournament.elo import EloRatings
+from checkers_bot_tournament.game import Game
+from checkers_bot_tournament.game_result import GameResult
+from checkers_bot_tournament.opening_book import OpeningBook
+
+# Shared secret between coordinator and workers, override with CHECKERS_AUTHKEY
+DEFAULT_AUTHKEY = os.environ.get("CHECKERS_AUTHKEY", "checkers-bot-tournament").encode()
+# Games handed to a worker at a time
+BATCH_SIZE = 4
+
+
+@dataclass
+class BotSpec:
+    # Where the bot class is imported from, see bot_registry.class_spec
+    class_spec: str
+    bot_id: int
+    rating: float
+
+
+@dataclass
+class GameTask:
+    game_id: int
+    game_round: int
+    white: BotSpec
+    black: BotSpec
+
+
+@dataclass
+class WorkerConfig:
+    """Sent to every worker when it connects, the same for all games of a tournament."""
+
+    board_start_builder: str
+    size: int
+    # PDN moves to start every game from (the contents of --pdn, not the path)
+    pdn: Optional[str]
+    verbose: bool
+    opening_book: Optional[OpeningBook]
+    seed: int
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"address {address} is not of the form host:port")
+    return host, int(port)
+
+
+def task_from_game(game: Game) -> GameTask:
+    def spec(tracker: BotTracker) -> BotSpec:
+        return BotSpec(class_spec(type(tracker.bot)), tracker.bot.bot_id, tracker.rating)
+
+    return GameTask(game.game_id, game.game_round, spec(game.white), spec(game.black))
+
+
+class Coordinator:
+    """
+    Serves a tournament's games to workers (see run_worker) over multiprocessing
+    connections.
+
+    Each connected worker is handed batches of games and streams a GameResult back for
+    every game as it finishes. If a worker disconnects, the games of its batch that haven't
+    come back yet go back on the queue for the other workers.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        config: WorkerConfig,
+        authkey: bytes = DEFAULT_AUTHKEY,
+        batch_size: int = BATCH_SIZE,
+        verbose: bool = False,
+    ):
+        self.config = config
+        self.batch_size = batch_size
+        self.verbose = verbose
+        self.listener = Listener(address, authkey=authkey)
+        self.tasks: queue.Queue[Optional[GameTask]] = queue.Queue()
+        self.results: dict[int, GameResult] = {}
+        self.results_changed = threading.Condition()
+        self.connections: list[Connection] = []
+        self.closed = False
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self.listener.address
+
+    def _accept(self) -> None:
+        while not self.closed:
+            try:
+                conn = self.listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                # Closed, or a client that failed authentication
+                continue
+            self.connections.append(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: Connection) -> None:
+        outstanding: dict[int, GameTask] = {}
+        try:
+            conn.send(self.config)
+            while True:
+                batch = self._next_batch()
+                if not batch:
+                    conn.send(None)
+                    return
+                outstanding = {task.game_id: task for task in batch}
+                conn.send(batch)
+                while outstanding:
+                    game_result: GameResult = conn.recv()
+                    outstanding.pop(game_result.game_id)
+                    with self.results_changed:
+                        self.results[game_result.game_id] = game_result
+                        self.results_changed.notify_all()
+        except (OSError, EOFError):
+            if self.verbose:
+                print(f"Worker disconnected, requeueing {len(outstanding)} games")
+            for task in outstanding.values():
+                self.tasks.put(task)
+        finally:
+            conn.close()
+
+    def _next_batch(self) -> list[GameTask]:
+        """Blocks for the next task, then takes whatever else is queued up to batch_size."""
+        task = self.tasks.get()
+        if task is None:
+            return []
+        batch = [task]
+        while len(batch) < self.batch_size:
+            try:
+                task = self.tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is None:
+                # Leave the shutdown marker for this worker's next batch
+                self.tasks.put(None)
+                break
+            batch.append(task)
+        return batch
+
+    def run_games(self, tasks: list[GameTask]) -> list[GameResult]:
+        """Plays tasks on the connected workers, returning results in the order of tasks."""
+        for task in tasks:
+            self.tasks.put(task)
+        with self.results_changed:
+            self.results_changed.wait_for(
+                lambda: all(task.game_id in self.results for task in tasks)
+            )
+            return [self.results.pop(task.game_id) for task in tasks]
+
+    def close(self) -> None:
+        """Tells workers to exit once they're done and stops accepting new ones."""
+        self.closed = True
+        for _ in self.connections:
+            self.tasks.put(None)
+        self.listener.close()
+
+
+class Worker:
+    def __init__(self, config: WorkerConfig):
+        self.config = config
+        self.board_start_builder = board_start_builder_mapping[config.board_start_builder](
+            config.size
+        )
+        # Bots are reused across games like they are in the Controller
+        self.bots: dict[tuple[str, int], Bot] = {}
+
+    def _get_bot(self, spec: BotSpec) -> Bot:
+        key = (spec.class_spec, spec.bot_id)
+        if key not in self.bots:
+            bot = load_bot_class(spec.class_spec)(bot_id=spec.bot_id)
+            bot.opening_book = self.config.opening_book
+            self.bots[key] = bot
+        return self.bots[key]
+
+    def run_task(self, task: GameTask) -> GameResult:
+        # Ratings don't change within a round, so a two bot table reproduces them exactly
+        h2h = H2HMatrix(2)
+        elo = EloRatings(2)
+        elo.ratings[:] = [task.white.rating, task.black.rating]
+        white = BotTracker(bot=self._get_bot(task.white), h2h=h2h, elo=elo, index=0)
+        black = BotTracker(bot=self._get_bot(task.black), h2h=h2h, elo=elo, index=1)
+
+        game = Game(
+            white,
+            black,
+            Board(self.board_start_builder),
+            task.game_id,
+            task.game_round,
+            self.config.verbose,
+            None,
+            self.config.seed,
+        )
+        if self.config.pdn:
+            game.import_pdn_moves(self.config.pdn)
+        return game.run()
+
+
+def run_worker(address: tuple[str, int], authkey: bytes = DEFAULT_AUTHKEY) -> int:
+    """Plays games for a Coordinator until it is done. Returns the number of games played."""
+    played = 0
+    with Client(address, authkey=authkey) as conn:
+        worker = Worker(conn.recv())
+        while True:
+            try:
+                batch: Optional[list[GameTask]] = conn.recv()
+            except EOFError:
+                break
+            if batch is None:
+                break
+            for task in batch:
+                conn.send(worker.run_task(task))
+                played += 1
+    return played
+
+
+def worker_main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="checkers worker", description="Play games for a tournament started with --serve"
+    )
+    parser.add_argument(
+        "--connect", type=str, required=True, metavar="HOST:PORT", help="Coordinator address."
+    )
+    args = parser.parse_args(argv)
+
+    played = run_worker(parse_address(args.connect))
+    print(f"Played {played} games")
@@ -0,0 +1,68 @@
+import numpy as np
+
+
+class EloConfig:
+    STARTING_ELO = 1500.0
+    # Dynamic learning rate as per USCF: K = 800/(Ne + m),
+    # where Ne is effective number of games a player's rating is based on, and
+    # m the number of games the player completed in a tournament for rating consideration
+    STARTING_KFACTOR = 800.0
+    # Each multiple of scale rating difference is a 10x increase in expected score
+    SCALE = 400.0
+
+
+# White's score indexed by RESULT_CODES (white win, draw, black win)
+WHITE_SCORES = np.array([1.0, 0.5, 0.0])
+
+
+class EloRatings:
+    """
+    Elo ratings and games played for the whole pool, indexed by BotTracker.index.
+
+    A round is rated in one pass: expected scores use the ratings from the start of the
+    round, and each bot's rating moves by K * (score - expected score) summed over the round,
+    with K = STARTING_KFACTOR / (games played before the round + games in the round).
+    """
+
+    def __init__(self, num_bots: int) -> None:
+        self.ratings = np.full(num_bots, EloConfig.STARTING_ELO)
+        self.games_played = np.zeros(num_bots, dtype=np.int64)
+
+    @property
+    def num_bots(self) -> int:
+        return self.ratings.shape[0]
+
+    def expected_scores(self, white: np.ndarray, black: np.ndarray) -> np.ndarray:
+        """White's expected score in each of the given pairings."""
+        # Only one power per bot rather than two per game. Computed with Python floats so the
+        # numbers match the scalar formula exactly.
+        q = np.array([10 ** (rating / EloConfig.SCALE) for rating in self.ratings.tolist()])
+        q_white = q[white]
+        return q_white / (q_white + q[black])
+
+    def rate_round(self, white: np.ndarray, black: np.ndarray, codes: np.ndarray) -> None:
+        """
+        Updates every bot's rating from one round of games, given as arrays of white and
+        black indices and RESULT_CODES.
+        """
+        if len(white) == 0:
+            return
+
+        ev_white = self.expected_scores(white, black)
+        score_white = WHITE_SCORES[codes]
+
+        # Interleave each game's white and black entries so that every bot's sums are
+        # accumulated in game order
+        players = np.stack([white, black], axis=1).ravel()
+        evs = np.stack([ev_white, 1 - ev_white], axis=1).ravel()
+        scores = np.stack([score_white, 1 - score_white], axis=1).ravel()
+
+        n = self.num_bots
+        round_games = np.bincount(players, minlength=n)
+        total_ev = np.bincount(players, weights=evs, minlength=n)
+        total_score = np.bincount(players, weights=scores, minlength=n)
+
+        played = round_games > 0
+        K = EloConfig.STARTING_KFACTOR / (self.games_played[played] + round_games[played])
+        self.ratings[played] += K * (total_score[played] - total_ev[played])
+        self.games_played += round_games
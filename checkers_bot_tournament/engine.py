@@ -0,0 +1,172 @@
+"""
+Line-based protocol for bots that run as separate processes ("engines").
+
+The tournament writes one request per line to the engine's stdin and reads replies from
+its stdout:
+
+    hello 1                                 ->  hello <name>
+    move <tag> <size> <colour> <board> <moves>  ->  <tag> <index>
+    quit
+
+colour is w or b, board has one character per dark square in PDN order (. empty, w/b men,
+W/B kings) and moves is a comma separated list of the legal moves in PDN ("22-17,21x14").
+The reply is the index of the chosen move in that list. Several games share an engine
+process, so every move request carries a tag that the engine echoes back with its answer.
+"""
+
+import asyncio
+import itertools
+import os
+from typing import Optional
+
+from checkers_bot_tournament.board import DISPLAY_CHARS, Board
+from checkers_bot_tournament.move import Move
+from checkers_bot_tournament.pdn import move_to_pdn
+from checkers_bot_tournament.piece import Colour
+
+PROTOCOL_VERSION = 1
+
+
+class EngineError(RuntimeError):
+    """The engine crashed, exited or didn't follow the protocol."""
+
+
+def encode_board(board: Board) -> str:
+    # Board.squares is already in PDN order
+    return "".join(DISPLAY_CHARS[code] for code in board.squares)
+
+
+def encode_move_request(tag: str, board: Board, colour: Colour, move_list: list[Move]) -> str:
+    moves = ",".join(move_to_pdn(move, board.size) for move in move_list)
+    colour_char = "w" if colour == Colour.WHITE else "b"
+    return f"move {tag} {board.size} {colour_char} {encode_board(board)} {moves}\n"
+
+
+class EngineProcess:
+    """
+    One running engine. Requests from any number of games can be in flight at once, replies
+    are matched to them by tag.
+    """
+
+    def __init__(self, command: list[str]):
+        self.command = command
+        self.name: Optional[str] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.reader: Optional[asyncio.Task] = None
+        self.pending: dict[str, asyncio.Future[str]] = {}
+        self.tags = itertools.count()
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.process is not None
+            and self.process.returncode is None
+            and self.reader is not None
+            and not self.reader.done()
+        )
+
+    async def start(self) -> None:
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE
+        )
+        assert self.process.stdin is not None and self.process.stdout is not None
+        try:
+            self.process.stdin.write(f"hello {PROTOCOL_VERSION}\n".encode())
+            await self.process.stdin.drain()
+            reply = (await self.process.stdout.readline()).decode().split()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise EngineError(f"engine {self.command[0]} exited on start") from e
+        if len(reply) < 2 or reply[0] != "hello":
+            raise EngineError(f"engine {self.command[0]} did not answer hello: {reply}")
+        self.name = " ".join(reply[1:])
+        self.reader = asyncio.create_task(self._read_replies())
+
+    async def _read_replies(self) -> None:
+        assert self.process is not None and self.process.stdout is not None
+        while line := await self.process.stdout.readline():
+            tag, _, reply = line.decode().strip().partition(" ")
+            future = self.pending.pop(tag, None)
+            if future is not None and not future.done():
+                future.set_result(reply)
+
+        # EOF, the engine is gone: fail every game still waiting on it
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(EngineError(f"engine {self.command[0]} exited"))
+        self.pending.clear()
+
+    async def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
+        if not self.alive:
+            raise EngineError(f"engine {self.command[0]} is not running")
+        assert self.process is not None and self.process.stdin is not None
+
+        tag = str(next(self.tags))
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self.pending[tag] = future
+        try:
+            self.process.stdin.write(encode_move_request(tag, board, colour, move_list).encode())
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self.pending.pop(tag, None)
+            raise EngineError(f"engine {self.command[0]} exited") from e
+
+        reply = await future
+        try:
+            return int(reply)
+        except ValueError:
+            raise EngineError(f"engine {self.command[0]} sent an invalid reply: {reply}")
+
+    async def close(self) -> None:
+        if self.process is None or self.process.returncode is not None:
+            return
+        assert self.process.stdin is not None
+        try:
+            self.process.stdin.write(b"quit\n")
+            await self.process.stdin.drain()
+            await asyncio.wait_for(self.process.wait(), timeout=5)
+        except (BrokenPipeError, ConnectionResetError, asyncio.TimeoutError):
+            self.process.kill()
+            await self.process.wait()
+
+
+class EnginePool:
+    """
+    Up to max_processes persistent processes of one engine, shared by every game it plays.
+    Moves go to the process with the fewest requests waiting, and processes are only started
+    once all running ones are busy. A process that crashed is replaced on the next request.
+    """
+
+    def __init__(self, path: str, max_processes: Optional[int] = None):
+        self.path = path
+        self.max_processes = max_processes or os.cpu_count() or 1
+        self.processes: list[EngineProcess] = []
+        self.lock = asyncio.Lock()
+
+    def get_name(self) -> str:
+        return os.path.basename(self.path)
+
+    async def _get_process(self) -> EngineProcess:
+        # Held while starting a process, so concurrent requests don't each start one
+        async with self.lock:
+            self.processes = [process for process in self.processes if process.alive]
+            idle = [process for process in self.processes if not process.pending]
+            if idle:
+                return idle[0]
+            if len(self.processes) < self.max_processes:
+                process = EngineProcess([self.path])
+                try:
+                    await process.start()
+                except (OSError, EngineError) as e:
+                    await process.close()
+                    raise EngineError(f"could not start engine {self.path}") from e
+                self.processes.append(process)
+                return process
+            return min(self.processes, key=lambda process: len(process.pending))
+
+    async def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
+        process = await self._get_process()
+        return await process.play_move(board, colour, move_list)
+
+    async def close(self) -> None:
+        await asyncio.gather(*(process.close() for process in self.processes))
+        self.processes = []
@@ -1,16 +1,25 @@
 import copy
-from typing import Optional, Tuple, overload
+import random
+from typing import Optional, overload
 
 from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.bots.base_bot import Bot
 from checkers_bot_tournament.bots.bot_tracker import BotTracker
 from checkers_bot_tournament.checkers_util import make_unique_bot_string
+from checkers_bot_tournament.engine import EngineError
 from checkers_bot_tournament.game_result import GameResult, Result
 from checkers_bot_tournament.move import Move
+from checkers_bot_tournament.pdn import move_to_pdn, pdn_to_move
 from checkers_bot_tournament.piece import Colour
 
 AUTO_DRAW_MOVECOUNT = 50 * 2
 
 
+def game_rng(seed: int, game_id: int, colour: Colour) -> random.Random:
+    """The random number generator of the bot playing colour in a game."""
+    return random.Random(f"{seed}:{game_id}:{colour.name}")
+
+
 class Game:
     def __init__(
         self,
@@ -21,6 +30,7 @@ class Game:
         game_round: int,
         verbose: bool,
         start_pdn: Optional[str],
+        seed: Optional[int] = None,
     ):
         self.white = white
         self.black = black
@@ -29,6 +39,7 @@ class Game:
         self.game_round = game_round
         self.verbose = verbose
         self.pdn = start_pdn
+        self.seed = seed
 
         self.current_turn = Colour.WHITE
         self.move_number = 1
@@ -55,22 +66,16 @@ class Game:
         """
         with open(filename, "r", encoding="utf-8") as file:
             pdn_content = file.read().strip()
+        self.import_pdn_moves(pdn_content)
 
+    def import_pdn_moves(self, pdn_content: str) -> None:
+        """
+        Plays the moves of a PDN string, e.g. the contents of a PDN file.
+        """
         moves = pdn_content.split()  # Assumes moves are space-separated
 
         for move in moves:
-            if "-" in move:  # Regular move
-                start, end = move.split("-")
-            elif "x" in move:  # Capture move
-                start, end = move.split("x")
-            else:
-                raise ValueError(f"Invalid move format: {move}")
-
-            start_pos = self._pdn_to_coordinates(start)
-            end_pos = self._pdn_to_coordinates(end)
-            removed_pos = self._get_removed_position(start_pos, end_pos) if "x" in move else None
-
-            move_obj = Move(start_pos, end_pos, removed_pos)
+            move_obj = pdn_to_move(move, self.board.size)
 
             if not self.board.is_valid_move(self.current_turn, move_obj):
                 raise RuntimeError(f"Invalid move in import_pdn: {move}")
@@ -100,16 +105,7 @@ class Game:
         If a filename is provided, the PDN content is written to the file.
         If no filename is provided, the PDN content is returned as a string.
         """
-        pdn_moves = []
-
-        for move in self.board.get_move_history():
-            start = self._coordinates_to_pdn(move.start)
-            end = self._coordinates_to_pdn(move.end)
-            if move.removed:
-                pdn_move = f"{start}x{end}"
-            else:
-                pdn_move = f"{start}-{end}"
-            pdn_moves.append(pdn_move)
+        pdn_moves = [move_to_pdn(move, self.board.size) for move in self.board.get_move_history()]
 
         pdn_content = " ".join(pdn_moves)
 
@@ -120,40 +116,15 @@ class Game:
         else:
             return pdn_content
 
-    def _pdn_to_coordinates(self, pdn: str) -> Tuple[int, int]:
-        """Converts a PDN square number to a (row, col) coordinate."""
-        square_num = int(pdn)
-        row = (square_num - 1) // (self.board.size // 2)
-        col = ((square_num - 1) % (self.board.size // 2)) * 2 + (1 if row % 2 == 0 else 0)
-
-        return row, col
-
-    def _coordinates_to_pdn(self, coord: Tuple[int, int]) -> str:
-        """Converts a (row, col) coordinate to a PDN square number."""
-        row, col = coord
-        square_num = row * (self.board.size // 2) + (col // 2) + 1
-        return str(square_num)
-
-    def _get_removed_position(
-        self, start: Tuple[int, int], end: Tuple[int, int]
-    ) -> Tuple[int, int]:
-        """Returns the position of the captured piece for a capture move."""
-        start_row, start_col = start
-        end_row, end_col = end
-        removed_row = (start_row + end_row) // 2
-        removed_col = (start_col + end_col) // 2
-        return removed_row, removed_col
-
     def make_move(self) -> Optional[Result]:
         bot = self.white.bot if self.current_turn == Colour.WHITE else self.black.bot
         move_list: list[Move] = self.board.get_move_list(self.current_turn)
 
         if len(move_list) == 0:
-            result = Result.BLACK if self.current_turn == Colour.WHITE else Result.WHITE
             # TODO: You can add extra information here (and pass it into write_game_result)
             # and GameResult as needed
             # self.write_game_result(result)
-            return result
+            return self._current_turn_loses()
 
         # TODO: Add a futures thingo to limit each bot to 10 seconds per move or smth
         # from concurrent.futures import ThreadPoolExecutor
@@ -163,7 +134,45 @@ class Game:
         #         return future.result(timeout=10)
         #     except TimeoutError:
         #         !!!
-        move_idx = bot.play_move(copy.deepcopy(self.board), self.current_turn, copy.copy(move_list))
+        try:
+            move_idx = bot.play_move(self._board_for(bot), self.current_turn, copy.copy(move_list))
+        except EngineError as e:
+            return self._forfeit(bot, e)
+        return self._play_move(bot, move_list, move_idx)
+
+    async def make_move_async(self) -> Optional[Result]:
+        """
+        Same as make_move, but awaits the bot so other games can play while an engine thinks.
+        """
+        bot = self.white.bot if self.current_turn == Colour.WHITE else self.black.bot
+        move_list: list[Move] = self.board.get_move_list(self.current_turn)
+
+        if len(move_list) == 0:
+            return self._current_turn_loses()
+
+        try:
+            move_idx = await bot.play_move_async(
+                self._board_for(bot), self.current_turn, copy.copy(move_list)
+            )
+        except EngineError as e:
+            return self._forfeit(bot, e)
+        return self._play_move(bot, move_list, move_idx)
+
+    def _board_for(self, bot: Bot) -> Board:
+        return self.board if bot.isolated else copy.deepcopy(self.board)
+
+    def _forfeit(self, bot: Bot, error: EngineError) -> Result:
+        # A crashed engine or bot process forfeits its own game, the rest of the tournament
+        # carries on
+        if self.verbose:
+            bot_string = make_unique_bot_string(bot.bot_id, bot.get_name())
+            self.moves_string += f"{bot_string} forfeits: {error}\n"
+        return self._current_turn_loses()
+
+    def _current_turn_loses(self) -> Result:
+        return Result.BLACK if self.current_turn == Colour.WHITE else Result.WHITE
+
+    def _play_move(self, bot: Bot, move_list: list[Move], move_idx: int) -> Optional[Result]:
         if move_idx < 0 or move_idx >= len(move_list):
             bot_string = make_unique_bot_string(bot.bot_id, bot.get_name())
             raise RuntimeError(f"bot: {bot_string} has played an invalid move")
@@ -208,7 +217,15 @@ class Game:
         else:
             self.black_kings_made += 1
 
+    def _start_game(self) -> None:
+        if self.seed is not None:
+            self.white.bot.rng = game_rng(self.seed, self.game_id, Colour.WHITE)
+            self.black.bot.rng = game_rng(self.seed, self.game_id, Colour.BLACK)
+        self.white.bot.start_game(self.game_id)
+        self.black.bot.start_game(self.game_id)
+
     def run(self) -> GameResult:
+        self._start_game()
         while True:
             # TODO: Implement chain moves (use is_first_move)
             result = self.make_move()
@@ -219,6 +236,17 @@ class Game:
 
         return self._write_game_result(result)
 
+    async def run_async(self) -> GameResult:
+        self._start_game()
+        while True:
+            result = await self.make_move_async()
+            if result:
+                break
+            else:
+                self.swap_turn()
+
+        return self._write_game_result(result)
+
     def _write_game_result(self, result: Result) -> GameResult:
         self.game_result = GameResult(
             game_id=self.game_id,
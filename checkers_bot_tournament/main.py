@@ -1,20 +1,36 @@
 import argparse
+import sys
 
+from checkers_bot_tournament.bot_registry import BotRegistry
 from checkers_bot_tournament.controller import Controller
+from checkers_bot_tournament.distributed import worker_main
+from checkers_bot_tournament.sprt import SPRTConfig
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "worker":
+        worker_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(description="checkers-board-tournament cli")
 
-    # Mode (required)
+    # Mode (required unless resuming)
     parser.add_argument(
         "--mode",
         type=str,
-        required=True,
         choices=["one", "all"],
         help="Mode of the game: 'one' for one bot against others, 'all' for all bots against each other.",
     )
 
+    parser.add_argument(
+        "--pairing",
+        type=str,
+        choices=["round-robin", "swiss"],
+        default="round-robin",
+        help="How bots are paired each round in 'all' mode: every pair plays both colours, or "
+        "swiss pairing by score and rating with one game per bot (default: round-robin).",
+    )
+
     parser.add_argument(
         "--board-start",
         type=str,
@@ -28,10 +44,12 @@ def main():
     parser.add_argument(
         "--bot",
         type=str,
-        help="Name or path of the bot to use (required in 'one' mode).",
+        help="Name of the bot, or path to an engine executable, to use (required in 'one' mode).",
     )
 
-    parser.add_argument("bot_list", type=str, nargs="+", help="List of bots")
+    parser.add_argument(
+        "bot_list", type=str, nargs="*", help="List of bots (names or engine executable paths)"
+    )
 
     # Board size
     parser.add_argument("--size", type=int, default=8, help="Size of the board (default: 8).")
@@ -46,6 +64,42 @@ def main():
 
     parser.add_argument("--export-pdn", action="store_true", help="Export as pdn output.")
 
+    parser.add_argument(
+        "--book",
+        type=str,
+        help="Opening book file (see checkers-book) that bots can probe with probe_book.",
+    )
+
+    parser.add_argument(
+        "--rating-model",
+        type=str,
+        choices=["elo", "bradley-terry"],
+        default="elo",
+        help="'bradley-terry' also fits batch ratings with confidence intervals over all games "
+        "(default: elo).",
+    )
+
+    parser.add_argument(
+        "--sprt",
+        action="store_true",
+        help="In 'one' mode, stop playing an opponent once an SPRT decides whether --bot is "
+        "better or worse. --rounds becomes the maximum number of rounds.",
+    )
+    parser.add_argument(
+        "--sprt-elo",
+        type=float,
+        nargs=2,
+        default=[-20.0, 20.0],
+        metavar=("ELO0", "ELO1"),
+        help="Elo difference of --bot over the opponent under H0 and H1 (default: -20 20).",
+    )
+    parser.add_argument(
+        "--sprt-alpha", type=float, default=0.05, help="SPRT false positive rate (default: 0.05)."
+    )
+    parser.add_argument(
+        "--sprt-beta", type=float, default=0.05, help="SPRT false negative rate (default: 0.05)."
+    )
+
     # Output directory
     parser.add_argument(
         "--output-dir",
@@ -54,8 +108,81 @@ def main():
         help="Directory to save output files (default: .).",
     )
 
+    parser.add_argument(
+        "--ratings-db",
+        type=str,
+        help="SQLite ratings database (see checkers-ratings). Bots start from their stored "
+        "ratings and every round is added to it.",
+    )
+
+    parser.add_argument(
+        "--serve",
+        type=str,
+        metavar="HOST:PORT",
+        help="Don't play games locally, serve them to workers started with "
+        "'checkers worker --connect HOST:PORT' (on this or other machines).",
+    )
+
+    parser.add_argument(
+        "--engine-processes",
+        type=int,
+        help="Maximum number of processes to run per engine bot (default: number of CPUs).",
+    )
+
+    parser.add_argument(
+        "--isolate-bots",
+        action="store_true",
+        help="Run every bot in its own long-lived process, set up once for the tournament. "
+        "A bot that crashes or raises forfeits the game instead of stopping the tournament.",
+    )
+
+    parser.add_argument(
+        "--bot-dir",
+        type=str,
+        action="append",
+        dest="bot_dirs",
+        metavar="DIR",
+        help="Directory with more bots, can be given more than once. Bots can also be given "
+        "as package.module:Class or path/to/file.py[:Class].",
+    )
+    parser.add_argument(
+        "--list-bots", action="store_true", help="List the bots that can be used by name."
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for the bots' random number generators, each game gets its own stream so "
+        "results don't depend on the order games are played in (default: random, printed "
+        "with --verbose).",
+    )
+
+    parser.add_argument(
+        "--resume",
+        type=str,
+        metavar="FOLDER",
+        help="Continue an interrupted tournament from the checkpoint in its results folder. "
+        "All other options are taken from the checkpoint.",
+    )
+
     args = parser.parse_args()
 
+    if args.list_bots:
+        registry = BotRegistry(args.bot_dirs)
+        for name in registry.names():
+            entry = registry.entries[name]
+            print(f"{name:<20}{entry.source:<14}{entry.spec}")
+        return
+
+    if args.resume:
+        Controller.resume(args.resume).run()
+        return
+
+    if args.mode is None:
+        parser.error("--mode is required unless resuming.")
+    if not args.bot_list:
+        parser.error("at least one bot is required in bot_list.")
+
     # Validation: Ensure either `bot` or `bot_list` is provided
     if args.mode == "single" and not args.bot:
         parser.error("--bot is required in single mode.")
@@ -64,6 +191,15 @@ def main():
 
     if args.rounds < 1:
         parser.error("rounds is required to be an integer >= 1")
+    if args.sprt and args.mode != "one":
+        parser.error("--sprt is only supported in one mode.")
+
+    sprt = None
+    if args.sprt:
+        elo0, elo1 = args.sprt_elo
+        if elo0 >= elo1:
+            parser.error("--sprt-elo requires ELO0 < ELO1")
+        sprt = SPRTConfig(elo0=elo0, elo1=elo1, alpha=args.sprt_alpha, beta=args.sprt_beta)
 
     # Create the controller
     controller = Controller(
@@ -77,5 +213,15 @@ def main():
         verbose=args.verbose,
         output_dir=args.output_dir,
         export_pdn=args.export_pdn,
+        book=args.book,
+        rating_model=args.rating_model,
+        sprt=sprt,
+        pairing=args.pairing,
+        ratings_db=args.ratings_db,
+        serve=args.serve,
+        engine_processes=args.engine_processes,
+        isolate_bots=args.isolate_bots,
+        bot_dirs=args.bot_dirs,
+        seed=args.seed,
     )
     controller.run()
@@ -0,0 +1,202 @@
+import argparse
+import random
+import struct
+from typing import Optional
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.game_result import Result
+from checkers_bot_tournament.move import Move
+from checkers_bot_tournament.pdn import (
+    coordinates_to_pdn,
+    get_removed_position,
+    pdn_to_coordinates,
+)
+from checkers_bot_tournament.piece import Colour
+from checkers_bot_tournament.position_hash import position_hash
+from checkers_bot_tournament.position_index import PositionIndex
+
+BOOK_MAGIC = b"CKBK"
+BOOK_VERSION = 1
+# magic, version, board size, number of entries
+HEADER = struct.Struct("<4sHHI")
+# position key, move (start square << 8 | end square), weight, games
+ENTRY = struct.Struct("<QHHI")
+MAX_WEIGHT = 0xFFFF
+
+# Book entries for one position: (encoded move, weight, games)
+BookMoves = list[tuple[int, int, int]]
+
+
+def encode_move(move: Move, size: int) -> int:
+    """Packs a move as its PDN start and end squares (captures are implied by the squares)."""
+    start = int(coordinates_to_pdn(move.start, size))
+    end = int(coordinates_to_pdn(move.end, size))
+    return (start << 8) | end
+
+
+def encode_pdn_move(pdn_move: str) -> int:
+    start, end = pdn_move.replace("x", "-").split("-")
+    return (int(start) << 8) | int(end)
+
+
+def decode_move(code: int, size: int) -> Move:
+    start = pdn_to_coordinates(str(code >> 8), size)
+    end = pdn_to_coordinates(str(code & 0xFF), size)
+    removed = get_removed_position(start, end) if abs(start[0] - end[0]) == 2 else None
+    return Move(start, end, removed)
+
+
+class OpeningBook:
+    """
+    Compact opening book: position hash -> weighted moves.
+
+    Weights follow the Polyglot convention of 2 * wins + draws for the side that played the
+    move, scaled down if needed to fit 16 bits, so the best scoring moves are preferred.
+    """
+
+    def __init__(self, size: int = 8, entries: Optional[dict[int, BookMoves]] = None):
+        self.size = size
+        self.entries: dict[int, BookMoves] = entries if entries is not None else {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self.entries
+
+    def probe(
+        self,
+        board: Board,
+        colour: Colour,
+        move_list: list[Move],
+        rng: Optional[random.Random] = None,
+    ) -> Optional[int]:
+        """
+        Returns the index into move_list of the book move for this position, or None if the
+        position is not in the book. Without an rng the heaviest move is played, otherwise a
+        move is drawn with probability proportional to its weight.
+        """
+        if board.size != self.size:
+            return None
+        book_moves = self.entries.get(position_hash(board, colour))
+        if not book_moves:
+            return None
+
+        weights = {code: weight for code, weight, _ in book_moves}
+        candidates: list[tuple[int, int]] = []
+        for idx, move in enumerate(move_list):
+            weight = weights.get(encode_move(move, board.size))
+            if weight is not None:
+                candidates.append((idx, weight))
+        if not candidates:
+            return None
+
+        if rng is None:
+            return max(candidates, key=lambda x: x[1])[0]
+        total = sum(weight for _, weight in candidates)
+        if total == 0:
+            return candidates[0][0]
+        return rng.choices([idx for idx, _ in candidates], [w for _, w in candidates])[0]
+
+    def save(self, path: str) -> None:
+        num_entries = sum(len(book_moves) for book_moves in self.entries.values())
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(BOOK_MAGIC, BOOK_VERSION, self.size, num_entries))
+            # Sorted by key so the file can also be binary searched in place
+            for key in sorted(self.entries):
+                for code, weight, games in self.entries[key]:
+                    file.write(ENTRY.pack(key, code, weight, games))
+
+    @classmethod
+    def load(cls, path: str) -> "OpeningBook":
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, size, num_entries = HEADER.unpack_from(data, 0)
+        if magic != BOOK_MAGIC or version != BOOK_VERSION:
+            raise ValueError(f"{path} is not a version {BOOK_VERSION} opening book")
+
+        entries: dict[int, BookMoves] = {}
+        for key, code, weight, games in ENTRY.iter_unpack(
+            data[HEADER.size : HEADER.size + num_entries * ENTRY.size]
+        ):
+            entries.setdefault(key, []).append((code, weight, games))
+        return cls(size, entries)
+
+    @classmethod
+    def from_index(
+        cls,
+        index: PositionIndex,
+        size: int = 8,
+        min_games: int = 1,
+        max_positions: Optional[int] = None,
+        max_ply: Optional[int] = None,
+    ) -> "OpeningBook":
+        """
+        Builds a book from a PositionIndex.
+
+        Positions reached in fewer than min_games games are skipped. If max_positions is set
+        only the most played positions are kept.
+        """
+        # key -> move -> [games, half points for the side to move]
+        stats: dict[int, dict[str, list[int]]] = {}
+        for key, ply, move, result, count in index.move_stats(max_ply):
+            mover = Result.WHITE if ply % 2 == 0 else Result.BLACK
+            winner = Result[result]
+            if winner == Result.DRAW:
+                half_points = count
+            elif winner == mover:
+                half_points = 2 * count
+            else:
+                half_points = 0
+            move_stats = stats.setdefault(key, {}).setdefault(move, [0, 0])
+            move_stats[0] += count
+            move_stats[1] += half_points
+
+        positions = [
+            (sum(games for games, _ in moves.values()), key, moves) for key, moves in stats.items()
+        ]
+        positions = [position for position in positions if position[0] >= min_games]
+        positions.sort(key=lambda x: (-x[0], x[1]))
+        if max_positions is not None:
+            positions = positions[:max_positions]
+
+        entries: dict[int, BookMoves] = {}
+        for _, key, moves in positions:
+            scale = max(1, -(-max(points for _, points in moves.values()) // MAX_WEIGHT))
+            entries[key] = [
+                (encode_pdn_move(move), points // scale, games)
+                for move, (games, points) in sorted(moves.items())
+            ]
+        return cls(size, entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="checkers-board-tournament opening book")
+    parser.add_argument("--index", type=str, required=True, help="Position index to build from.")
+    parser.add_argument("--out", type=str, default="book.bin", help="Book file to write.")
+    parser.add_argument("--size", type=int, default=8, help="Size of the board (default: 8).")
+    parser.add_argument(
+        "--min-games",
+        type=int,
+        default=5,
+        help="Only keep positions reached in at least this many games (default: 5).",
+    )
+    parser.add_argument(
+        "--max-positions", type=int, help="Keep at most this many (most played) positions."
+    )
+    parser.add_argument(
+        "--max-ply", type=int, default=20, help="Only use the first N plies (default: 20)."
+    )
+    args = parser.parse_args()
+
+    with PositionIndex(args.index) as index:
+        book = OpeningBook.from_index(
+            index,
+            size=args.size,
+            min_games=args.min_games,
+            max_positions=args.max_positions,
+            max_ply=args.max_ply,
+        )
+    book.save(args.out)
+    print(f"{len(book)} positions written to {args.out}")
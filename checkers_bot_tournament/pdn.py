@@ -0,0 +1,53 @@
+from typing import Tuple
+
+from checkers_bot_tournament.move import Move
+
+
+def pdn_to_coordinates(pdn: str, size: int) -> Tuple[int, int]:
+    """Converts a PDN square number to a (row, col) coordinate."""
+    square_num = int(pdn)
+    row = (square_num - 1) // (size // 2)
+    col = ((square_num - 1) % (size // 2)) * 2 + (1 if row % 2 == 0 else 0)
+
+    return row, col
+
+
+def coordinates_to_pdn(coord: Tuple[int, int], size: int) -> str:
+    """Converts a (row, col) coordinate to a PDN square number."""
+    row, col = coord
+    square_num = row * (size // 2) + (col // 2) + 1
+    return str(square_num)
+
+
+def get_removed_position(start: Tuple[int, int], end: Tuple[int, int]) -> Tuple[int, int]:
+    """Returns the position of the captured piece for a capture move."""
+    start_row, start_col = start
+    end_row, end_col = end
+    removed_row = (start_row + end_row) // 2
+    removed_col = (start_col + end_col) // 2
+    return removed_row, removed_col
+
+
+def pdn_to_move(pdn_move: str, size: int) -> Move:
+    """Converts a single PDN move such as "22-17" or "23x16" to a Move."""
+    if "-" in pdn_move:  # Regular move
+        start, end = pdn_move.split("-")
+    elif "x" in pdn_move:  # Capture move
+        start, end = pdn_move.split("x")
+    else:
+        raise ValueError(f"Invalid move format: {pdn_move}")
+
+    start_pos = pdn_to_coordinates(start, size)
+    end_pos = pdn_to_coordinates(end, size)
+    removed_pos = get_removed_position(start_pos, end_pos) if "x" in pdn_move else None
+
+    return Move(start_pos, end_pos, removed_pos)
+
+
+def move_to_pdn(move: Move, size: int) -> str:
+    """Converts a Move to its PDN representation."""
+    start = coordinates_to_pdn(move.start, size)
+    end = coordinates_to_pdn(move.end, size)
+    if move.removed:
+        return f"{start}x{end}"
+    return f"{start}-{end}"
@@ -18,3 +18,26 @@ class Piece:
         self.position = position
         self.colour = colour
         self.is_king = is_king
+
+
+# What a square of Board.squares holds. The low bits are the colour, so a piece is ours if
+# code & man_code(colour), and KING is set for kings.
+EMPTY = 0
+WHITE_MAN = 1
+BLACK_MAN = 2
+KING = 4
+WHITE_KING = WHITE_MAN | KING
+BLACK_KING = BLACK_MAN | KING
+
+
+def man_code(colour: Colour) -> int:
+    return WHITE_MAN if colour == Colour.WHITE else BLACK_MAN
+
+
+def piece_code(piece: Piece) -> int:
+    return man_code(piece.colour) | (KING if piece.is_king else 0)
+
+
+def piece_from_code(code: int, position: Tuple[int, int]) -> Piece:
+    colour = Colour.WHITE if code & WHITE_MAN else Colour.BLACK
+    return Piece(position, colour, bool(code & KING))
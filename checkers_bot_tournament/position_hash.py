@@ -0,0 +1,44 @@
+import random
+from functools import lru_cache
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.piece import BLACK_KING, BLACK_MAN, WHITE_KING, WHITE_MAN, Colour
+
+# Fixed so that hashes are stable across runs and machines, which is what lets
+# on-disk indexes and opening books be shared.
+ZOBRIST_SEED = 20241208
+# Keep keys within 63 bits so they fit a signed SQLite INTEGER column.
+HASH_BITS = 63
+
+
+@lru_cache(maxsize=None)
+def _zobrist_tables(size: int) -> tuple[list[list[int]], int]:
+    """
+    One random key per (dark square, piece kind) plus one for black to move.
+    Piece kinds are indexed by _PIECE_KIND.
+    """
+    rng = random.Random(f"{ZOBRIST_SEED}:{size}")
+    num_squares = size * size // 2
+    square_keys = [[rng.getrandbits(HASH_BITS) for _ in range(4)] for _ in range(num_squares)]
+    black_to_move = rng.getrandbits(HASH_BITS)
+    return square_keys, black_to_move
+
+
+# Index into a square's keys for each square code
+_PIECE_KIND = {WHITE_MAN: 0, WHITE_KING: 1, BLACK_MAN: 2, BLACK_KING: 3}
+
+
+def position_hash(board: Board, colour: Colour) -> int:
+    """
+    Zobrist hash of the pieces on the board and the side to move.
+
+    Dark squares are numbered the same way as PDN squares (minus one), like
+    Board.squares, so the hash doesn't change with how the board is stored.
+    """
+    square_keys, black_to_move = _zobrist_tables(board.size)
+
+    h = black_to_move if colour == Colour.BLACK else 0
+    for pieces in (board.white_pieces, board.black_pieces):
+        for index in pieces:
+            h ^= square_keys[index][_PIECE_KIND[board.squares[index]]]
+    return h
@@ -0,0 +1,243 @@
+import argparse
+import glob
+import os
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.board_start_builder import (
+    BoardStartBuilder,
+    DefaultBSB,
+    board_start_builder_mapping,
+)
+from checkers_bot_tournament.game_result import Result
+from checkers_bot_tournament.pdn import move_to_pdn, pdn_to_move
+from checkers_bot_tournament.piece import Colour
+from checkers_bot_tournament.position_hash import position_hash
+
+PDN_FILE_PATTERN = re.compile(r"game_(\d+)\.pdn$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    game_id INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    UNIQUE (source, game_id)
+);
+CREATE TABLE IF NOT EXISTS positions (
+    key INTEGER NOT NULL,
+    game INTEGER NOT NULL REFERENCES games (id),
+    ply INTEGER NOT NULL,
+    move TEXT
+);
+CREATE INDEX IF NOT EXISTS positions_key ON positions (key);
+"""
+
+
+@dataclass
+class ReplayedGame:
+    # (position hash, PDN move played from that position), the final position has no move
+    positions: list[tuple[int, Optional[str]]]
+    result: Result
+
+
+@dataclass
+class PositionStats:
+    key: int
+    # (source, game_id) of every game the position occurred in
+    games: list[tuple[str, int]] = field(default_factory=list)
+    # PDN move -> number of times it was played from this position
+    moves: dict[str, int] = field(default_factory=dict)
+    white_wins: int = 0
+    draws: int = 0
+    black_wins: int = 0
+
+    @property
+    def total_games(self) -> int:
+        return self.white_wins + self.draws + self.black_wins
+
+
+def replay_pdn(pdn_content: str, board_start_builder: BoardStartBuilder) -> ReplayedGame:
+    """
+    Replays a PDN move list from the start position and hashes every position on the way.
+
+    Exported PDNs carry no result tag, but games only ever end when the side to move has no
+    moves (a loss for them) or by the automatic draw rule, so the result can be recovered
+    from the final position.
+    """
+    board = Board(board_start_builder, board_start_builder.size)
+    colour = Colour.WHITE
+    positions: list[tuple[int, Optional[str]]] = []
+
+    for pdn_move in pdn_content.split():
+        move = pdn_to_move(pdn_move, board.size)
+        if not board.is_valid_move(colour, move):
+            raise ValueError(f"Invalid move in replay_pdn: {pdn_move}")
+        positions.append((position_hash(board, colour), move_to_pdn(move, board.size)))
+        board.move_piece(move)
+        colour = colour.get_opposite()
+
+    positions.append((position_hash(board, colour), None))
+
+    if board.get_move_list(colour):
+        result = Result.DRAW
+    else:
+        result = Result.BLACK if colour == Colour.WHITE else Result.WHITE
+
+    return ReplayedGame(positions, result)
+
+
+class PositionIndex:
+    """
+    On-disk (SQLite) index from position hash to the archived games it occurred in.
+
+    Games are identified by the results folder they came from (its basename, so the archive
+    can be moved) and their game id within that tournament. Adding a folder that is already
+    indexed only adds games that are new, so the index can be updated after every tournament.
+    """
+
+    def __init__(self, path: str, board_start_builder: Optional[BoardStartBuilder] = None):
+        self.path = path
+        self.board_start_builder = board_start_builder or DefaultBSB()
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "PositionIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def add_folder(self, folder: str) -> int:
+        """Indexes every exported game_X.pdn in a results folder. Returns the number added."""
+        source = os.path.basename(os.path.normpath(folder))
+        games: list[tuple[int, str]] = []
+        for path in sorted(glob.glob(os.path.join(folder, "game_*.pdn"))):
+            match = PDN_FILE_PATTERN.search(path)
+            if match is None:
+                continue
+            with open(path, "r", encoding="utf-8") as file:
+                games.append((int(match.group(1)), file.read().strip()))
+        return self.add_games(source, games)
+
+    def add_games(self, source: str, games: Iterable[tuple[int, str]]) -> int:
+        """Indexes (game_id, pdn_content) pairs, skipping games already in the index."""
+        known = {
+            row[0]
+            for row in self.conn.execute("SELECT game_id FROM games WHERE source = ?", (source,))
+        }
+        added = 0
+        with self.conn:
+            for game_id, pdn_content in games:
+                if game_id in known:
+                    continue
+                replayed = replay_pdn(pdn_content, self.board_start_builder)
+                cursor = self.conn.execute(
+                    "INSERT INTO games (source, game_id, result) VALUES (?, ?, ?)",
+                    (source, game_id, replayed.result.name),
+                )
+                row_id = cursor.lastrowid
+                self.conn.executemany(
+                    "INSERT INTO positions (key, game, ply, move) VALUES (?, ?, ?, ?)",
+                    [
+                        (key, row_id, ply, move)
+                        for ply, (key, move) in enumerate(replayed.positions)
+                    ],
+                )
+                known.add(game_id)
+                added += 1
+        return added
+
+    def query(self, key: int) -> PositionStats:
+        stats = PositionStats(key)
+        seen_games: set[int] = set()
+        rows = self.conn.execute(
+            "SELECT g.id, g.source, g.game_id, g.result, p.move "
+            "FROM positions p JOIN games g ON g.id = p.game WHERE p.key = ?",
+            (key,),
+        )
+        for row_id, source, game_id, result, move in rows:
+            if move is not None:
+                stats.moves[move] = stats.moves.get(move, 0) + 1
+            # A position can repeat within a game, count the game once
+            if row_id in seen_games:
+                continue
+            seen_games.add(row_id)
+            stats.games.append((source, game_id))
+            match Result[result]:
+                case Result.WHITE:
+                    stats.white_wins += 1
+                case Result.BLACK:
+                    stats.black_wins += 1
+                case Result.DRAW:
+                    stats.draws += 1
+        return stats
+
+    def query_board(self, board: Board, colour: Colour) -> PositionStats:
+        return self.query(position_hash(board, colour))
+
+    def move_stats(self, max_ply: Optional[int] = None) -> Iterable[tuple[int, int, str, str, int]]:
+        """
+        Yields (position key, ply, move, result, count) for every move played in the index,
+        optionally only for moves played before max_ply. The ply is that of the first
+        occurrence, its parity gives the side to move.
+        """
+        return self.conn.execute(
+            "SELECT p.key, MIN(p.ply), p.move, g.result, COUNT(*) "
+            "FROM positions p JOIN games g ON g.id = p.game "
+            "WHERE p.move IS NOT NULL AND p.ply < ? GROUP BY p.key, p.move, g.result",
+            (max_ply if max_ply is not None else 2**31,),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="checkers-board-tournament position index")
+    parser.add_argument("--index", type=str, default="positions.db", help="Index file.")
+    parser.add_argument(
+        "--board-start",
+        type=str,
+        choices=list(board_start_builder_mapping),
+        default="default",
+        help="Initial board start the indexed games were played from.",
+    )
+    parser.add_argument("--size", type=int, default=8, help="Size of the board (default: 8).")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = subparsers.add_parser("add", help="Index results folders (run with --export-pdn)")
+    add_parser.add_argument("folders", type=str, nargs="+")
+
+    query_parser = subparsers.add_parser("query", help="Look up the position after some moves")
+    query_parser.add_argument(
+        "--moves", type=str, default="", help='Space separated PDN moves, e.g. "22-17 11-15"'
+    )
+
+    args = parser.parse_args()
+    board_start_builder = board_start_builder_mapping[args.board_start](args.size)
+
+    with PositionIndex(args.index, board_start_builder) as index:
+        match args.command:
+            case "add":
+                for folder in args.folders:
+                    added = index.add_folder(folder)
+                    print(f"{folder}: {added} new games indexed")
+            case "query":
+                board = Board(board_start_builder, args.size)
+                colour = Colour.WHITE
+                for pdn_move in args.moves.split():
+                    board.move_piece(pdn_to_move(pdn_move, args.size))
+                    colour = colour.get_opposite()
+
+                stats = index.query_board(board, colour)
+                total = stats.total_games
+                print(board.display())
+                print(f"Games: {total}")
+                if total:
+                    print(f"White/Draw/Black: {stats.white_wins}/{stats.draws}/{stats.black_wins}")
+                for move, count in sorted(stats.moves.items(), key=lambda x: -x[1]):
+                    print(f"{move:<8}{count}")
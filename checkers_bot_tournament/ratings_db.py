@@ -0,0 +1,166 @@
+import argparse
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from checkers_bot_tournament.elo import EloConfig
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bots (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    rating REAL NOT NULL,
+    games_played INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    run TEXT NOT NULL,
+    game_id INTEGER NOT NULL,
+    white INTEGER NOT NULL REFERENCES bots (id),
+    black INTEGER NOT NULL REFERENCES bots (id),
+    result TEXT NOT NULL,
+    played_at REAL NOT NULL,
+    UNIQUE (run, game_id)
+);
+CREATE INDEX IF NOT EXISTS games_white ON games (white, played_at);
+CREATE INDEX IF NOT EXISTS games_black ON games (black, played_at);
+CREATE TABLE IF NOT EXISTS rating_history (
+    bot INTEGER NOT NULL REFERENCES bots (id),
+    run TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    recorded_at REAL NOT NULL,
+    rating REAL NOT NULL,
+    games_played INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rating_history_bot ON rating_history (bot, recorded_at);
+"""
+
+# (game id, white bot name, black bot name, result name)
+GameRecord = tuple[int, str, str, str]
+
+
+class RatingsDB:
+    """
+    On-disk (SQLite) store of ratings, games and rating history that carries over between
+    tournament runs.
+
+    Bots are keyed by name, so every instance of a bot in a run starts from the stored
+    rating. A run is identified by its results folder name and each round is recorded in a
+    single transaction. Rating history is indexed by bot and time, so the trend of one bot
+    only reads that bot's rows.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "RatingsDB":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _bot_ids(self, names: Iterable[str]) -> dict[str, int]:
+        names = set(names)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO bots (name, rating, games_played) VALUES (?, ?, 0)",
+            [(name, EloConfig.STARTING_ELO) for name in names],
+        )
+        return {
+            name: bot_id
+            for bot_id, name in self.conn.execute("SELECT id, name FROM bots")
+            if name in names
+        }
+
+    def load(self, names: Iterable[str]) -> dict[str, tuple[float, int]]:
+        """Stored (rating, games played) for each of the names that has been seen before."""
+        names = set(names)
+        return {
+            name: (rating, games_played)
+            for name, rating, games_played in self.conn.execute(
+                "SELECT name, rating, games_played FROM bots"
+            )
+            if name in names
+        }
+
+    def record_round(
+        self,
+        run: str,
+        rnd: int,
+        games: list[GameRecord],
+        ratings: dict[str, tuple[float, int]],
+    ) -> bool:
+        """
+        Records the games of a round and each bot's rating after it, given as name ->
+        (rating, games played this round). Returns False without changing anything if the
+        round's games are already stored, e.g. when a run is resumed from a checkpoint.
+        """
+        now = time.time()
+        with self.conn:
+            bot_ids = self._bot_ids(ratings)
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO games (run, game_id, white, black, result, played_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run, game_id, bot_ids[white], bot_ids[black], result, now)
+                    for game_id, white, black, result in games
+                ],
+            )
+            if games and cursor.rowcount == 0:
+                return False
+
+            self.conn.executemany(
+                "UPDATE bots SET rating = ?, games_played = games_played + ? WHERE id = ?",
+                [
+                    (rating, new_games, bot_ids[name])
+                    for name, (rating, new_games) in ratings.items()
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO rating_history (bot, run, round, recorded_at, rating, games_played) "
+                "SELECT id, ?, ?, ?, rating, games_played FROM bots WHERE id = ?",
+                [(run, rnd, now, bot_ids[name]) for name in ratings],
+            )
+        return True
+
+    def rating_trend(
+        self, name: str, since: Optional[datetime] = None
+    ) -> list[tuple[datetime, float]]:
+        """(time, rating) after every recorded round the bot played, oldest first."""
+        rows = self.conn.execute(
+            "SELECT h.recorded_at, h.rating FROM rating_history h "
+            "JOIN bots b ON b.id = h.bot "
+            "WHERE b.name = ? AND h.recorded_at >= ? ORDER BY h.recorded_at",
+            (name, since.timestamp() if since is not None else 0.0),
+        )
+        return [(datetime.fromtimestamp(recorded_at), rating) for recorded_at, rating in rows]
+
+    def leaderboard(self) -> list[tuple[str, float, int]]:
+        """(name, rating, games played) of every stored bot, highest rated first."""
+        return list(
+            self.conn.execute("SELECT name, rating, games_played FROM bots ORDER BY rating DESC")
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="checkers-board-tournament ratings database")
+    parser.add_argument("--db", type=str, default="ratings.db", help="Ratings database file.")
+    parser.add_argument("--trend", type=str, metavar="BOT", help="Show the rating trend of a bot.")
+    parser.add_argument(
+        "--days", type=int, default=30, help="How far back --trend goes (default: 30)."
+    )
+    args = parser.parse_args()
+
+    with RatingsDB(args.db) as db:
+        if args.trend:
+            since = datetime.now() - timedelta(days=args.days)
+            for recorded_at, rating in db.rating_trend(args.trend, since):
+                print(f"{recorded_at:%Y-%m-%d %H:%M}  {rating:.0f}")
+        else:
+            for name, rating, games_played in db.leaderboard():
+                print(f"{name:<20}{rating:>8.0f}{games_played:>10}")
@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from enum import Enum, auto
+from math import log
+
+from checkers_bot_tournament.elo import EloConfig
+
+
+class SPRTResult(Enum):
+    UNDECIDED = auto()
+    # H1 accepted: the hero is at least elo1 stronger
+    BETTER = auto()
+    # H0 accepted: the hero is at most elo0 stronger (i.e. weaker for a negative elo0)
+    WORSE = auto()
+
+
+@dataclass
+class SPRTConfig:
+    # Elo difference (hero - opponent) under H0 and H1
+    elo0: float = -20.0
+    elo1: float = 20.0
+    # False positive (accept H1 when H0 holds) and false negative rates
+    alpha: float = 0.05
+    beta: float = 0.05
+
+    @property
+    def lower_bound(self) -> float:
+        return log(self.beta / (1 - self.alpha))
+
+    @property
+    def upper_bound(self) -> float:
+        return log((1 - self.beta) / self.alpha)
+
+
+def elo_to_score(elo: float) -> float:
+    return 1 / (1 + 10 ** (-elo / EloConfig.SCALE))
+
+
+def sprt_llr(wins: int, draws: int, losses: int, elo0: float, elo1: float) -> float:
+    """
+    Log-likelihood ratio of H1 (elo1) over H0 (elo0) for a W/D/L record, using the
+    generalised SPRT normal approximation for trinomial results:
+
+        LLR = N * (s1 - s0) * (2 * x - s0 - s1) / (2 * var)
+
+    where x is the mean score, var its per-game variance and s0, s1 the expected scores
+    under each hypothesis. Half a pseudo-game of each outcome goes into the variance so that
+    a short run of identical results doesn't give an infinite LLR.
+    """
+    total = wins + draws + losses
+    if total == 0:
+        return 0.0
+    x = (wins + 0.5 * draws) / total
+
+    w, d, l = wins + 0.5, draws + 0.5, losses + 0.5
+    reg_total = w + d + l
+    reg_x = (w + 0.5 * d) / reg_total
+    var = (w * (1 - reg_x) ** 2 + d * (0.5 - reg_x) ** 2 + l * reg_x**2) / reg_total
+
+    s0, s1 = elo_to_score(elo0), elo_to_score(elo1)
+    return total * (s1 - s0) * (2 * x - s0 - s1) / (2 * var)
+
+
+def sprt_status(wins: int, draws: int, losses: int, config: SPRTConfig) -> SPRTResult:
+    llr = sprt_llr(wins, draws, losses, config.elo0, config.elo1)
+    if llr >= config.upper_bound:
+        return SPRTResult.BETTER
+    if llr <= config.lower_bound:
+        return SPRTResult.WORSE
+    return SPRTResult.UNDECIDED
@@ -2,7 +2,9 @@ from math import inf
 from typing import IO
 
 from checkers_bot_tournament.bots.bot_tracker import BotTracker
+from checkers_bot_tournament.bradley_terry import fit_bradley_terry
 from checkers_bot_tournament.checkers_util import compute_performance_rating, make_unique_bot_string
+from checkers_bot_tournament.sprt import SPRTConfig, SPRTResult, sprt_llr
 
 
 def write_tournament_overall_stats(bot_list: list[BotTracker], file: IO) -> None:
@@ -89,24 +91,27 @@ def write_tournament_h2h_stats(bot_list: list[BotTracker], file: IO) -> None:
     file.write("Head-to-Head Statistics\n")
     file.write("=" * 100 + "\n\n")
 
+    # Read every pair's W/D/L straight from the shared h2h matrix
+    wins, draws, losses = bot_list[0].h2h.wdl()
+    bot_names = [make_unique_bot_string(bot) for bot in bot_list]
+
     # Prepare headers
     # We'll print a matrix where rows and columns are bots
     # Column headers: each opponent bot
-    max_name_len = max(len(make_unique_bot_string(bot)) for bot in bot_list)
+    max_name_len = max(len(bot_name) for bot_name in bot_names)
     name_col_width = max_name_len + 8  # some padding for rating
     cell_width = max(30, name_col_width)  # width for each cell to display W/D/L and PerfRating
 
     # Print top header row
     file.write(" " * name_col_width)  # empty space for the left top corner
-    for bot in bot_list[1:]:
-        bot_str = make_unique_bot_string(bot)
+    for bot, bot_str in zip(bot_list[1:], bot_names[1:]):
         file.write(f"{bot_str} ({round(bot.rating)})".center(cell_width))
     file.write("\n")
     file.write("-" * (name_col_width + (len(bot_list) - 1) * cell_width) + "\n")
 
     # Print each row
     for i, row_bot in enumerate(bot_list):
-        row_str = f"{make_unique_bot_string(row_bot)} ({round(row_bot.rating)})"
+        row_str = f"{bot_names[i]} ({round(row_bot.rating)})"
 
         # We'll build two lines for each row:
         # line1: from row bot perspective (with W/D/L)
@@ -125,23 +130,15 @@ def write_tournament_h2h_stats(bot_list: list[BotTracker], file: IO) -> None:
                 cell_bottom = " " * 1 + "-" * (cell_width - 2) + " " * 1
             else:
                 # Top half: show stats
-                row_bot_name = make_unique_bot_string(row_bot)
                 row_bot_id = row_bot.bot.bot_id
-
-                col_bot_name = make_unique_bot_string(col_bot)
                 col_bot_id = col_bot.bot.bot_id
+                r, c = row_bot.index, col_bot.index
 
                 # Row perspective stats: row_bot vs col_bot
-                stat_row_vs_col = row_bot.h2h_stats[col_bot_name]
-                w_rc = stat_row_vs_col.total_wins
-                d_rc = stat_row_vs_col.total_draws
-                l_rc = stat_row_vs_col.total_losses
+                w_rc, d_rc, l_rc = int(wins[r, c]), int(draws[r, c]), int(losses[r, c])
 
                 # Column perspective stats: col_bot vs row_bot
-                stat_col_vs_row = col_bot.h2h_stats[row_bot_name]
-                w_cr = stat_col_vs_row.total_wins
-                d_cr = stat_col_vs_row.total_draws
-                l_cr = stat_col_vs_row.total_losses
+                w_cr, d_cr, l_cr = int(wins[c, r]), int(draws[c, r]), int(losses[c, r])
 
                 if (w_rc + d_rc + l_rc) == 0:
                     # No games played between these bots
@@ -208,3 +205,83 @@ def write_tournament_h2h_stats(bot_list: list[BotTracker], file: IO) -> None:
         file.write(line2 + "\n" * 2)
 
     file.write("=" * 100 + "\n\n")
+
+
+def write_tournament_bt_stats(bot_list: list[BotTracker], file: IO) -> None:
+    """
+    Writes Bradley-Terry ratings fitted over every game of the tournament at once, with 95%
+    confidence intervals, ranked from strongest to weakest.
+
+    Unlike the Elo ratings these do not depend on the order the games were played in.
+    """
+    h2h = bot_list[0].h2h
+    wins, draws, losses = h2h.wdl()
+    fit = fit_bradley_terry(wins, draws)
+    low, high = fit.interval()
+    games = (wins + draws + losses).sum(axis=1)
+
+    file.write("Bradley-Terry Ratings (95% confidence intervals)\n")
+    file.write("=" * 80 + "\n\n")
+
+    name_width = max(len(make_unique_bot_string(bot)) for bot in bot_list) + 2
+    header = f"{'Rank':<6}{'Bot':<{name_width}}{'Rating':>8}{'95% CI':>16}{'±':>8}{'Games':>8}"
+    file.write(header + "\n")
+    file.write("-" * len(header) + "\n")
+
+    ranked = sorted(bot_list, key=lambda bot: -fit.ratings[bot.index])
+    for rank, bot in enumerate(ranked, start=1):
+        i = bot.index
+        name = make_unique_bot_string(bot)
+        if games[i] == 0:
+            ci_str = "N/A"
+            pm_str = "N/A"
+        else:
+            ci_str = f"{round(low[i])} - {round(high[i])}"
+            pm_str = str(round(1.96 * fit.std_errors[i]))
+        file.write(
+            f"{rank:<6}{name:<{name_width}}{round(fit.ratings[i]):>8}"
+            f"{ci_str:>16}{pm_str:>8}{int(games[i]):>8}\n"
+        )
+
+    equal_draw_rate = fit.draw_nu / (2 + fit.draw_nu) * 100
+    file.write(f"\nDraw rate between equal bots: {equal_draw_rate:.1f}%\n")
+    file.write("=" * 80 + "\n\n")
+
+
+def write_tournament_sprt_stats(
+    hero_bot: BotTracker,
+    bot_list: list[BotTracker],
+    sprt_results: dict[int, SPRTResult],
+    config: SPRTConfig,
+    file: IO,
+) -> None:
+    """
+    Writes the SPRT outcome of the hero bot against each opponent, with the W/D/L record
+    (from the hero's perspective) and log-likelihood ratio it was decided on.
+    """
+    file.write(
+        f"SPRT: {make_unique_bot_string(hero_bot)} "
+        f"H0: {config.elo0:+g} Elo, H1: {config.elo1:+g} Elo, "
+        f"alpha={config.alpha:g}, beta={config.beta:g}\n"
+    )
+    file.write("=" * 80 + "\n\n")
+
+    name_width = max(len(make_unique_bot_string(bot)) for bot in bot_list) + 2
+    header = f"{'Opponent':<{name_width}}{'W/D/L':>14}{'Games':>8}{'LLR':>10}  Result"
+    file.write(header + "\n")
+    file.write("-" * (len(header) + 10) + "\n")
+
+    bounds = f"({config.lower_bound:.2f}, {config.upper_bound:.2f})"
+    for bot in bot_list:
+        stat = hero_bot.h2h_stat(bot)
+        llr = sprt_llr(
+            stat.total_wins, stat.total_draws, stat.total_losses, config.elo0, config.elo1
+        )
+        wdl_str = f"{stat.total_wins}/{stat.total_draws}/{stat.total_losses}"
+        file.write(
+            f"{make_unique_bot_string(bot):<{name_width}}{wdl_str:>14}{stat.total_games:>8}"
+            f"{llr:>10.2f}  {sprt_results[bot.index].name}\n"
+        )
+
+    file.write(f"\nLLR bounds: {bounds}\n")
+    file.write("=" * 80 + "\n\n")
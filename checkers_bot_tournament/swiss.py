@@ -0,0 +1,97 @@
+from typing import Optional
+
+import numpy as np
+
+from checkers_bot_tournament.bots.bot_tracker import H2HColumn, H2HMatrix
+
+# Upper bound on pairing attempts before falling back to allowing rematches
+MAX_PAIRING_STEPS = 100_000
+
+
+def _pair_without_rematches(
+    order: list[int], played: np.ndarray
+) -> Optional[list[tuple[int, int]]]:
+    """
+    Pairs players top-down in ranking order, each with the highest ranked opponent they
+    haven't played yet, backtracking when the rest of the field can't be paired.
+    Returns None if no such pairing was found within MAX_PAIRING_STEPS.
+    """
+    steps = 0
+    pairs: list[tuple[int, int]] = []
+
+    def solve(remaining: list[int]) -> bool:
+        nonlocal steps
+        if not remaining:
+            return True
+        top, rest = remaining[0], remaining[1:]
+        for k, opponent in enumerate(rest):
+            steps += 1
+            if steps > MAX_PAIRING_STEPS:
+                return False
+            if played[top, opponent]:
+                continue
+            pairs.append((top, opponent))
+            if solve(rest[:k] + rest[k + 1 :]):
+                return True
+            pairs.pop()
+        return False
+
+    return pairs if solve(order) else None
+
+
+def _pair_fewest_rematches(order: list[int], games: np.ndarray) -> list[tuple[int, int]]:
+    """Greedy fallback: pairs each player with the opponent they've played least."""
+    pairs: list[tuple[int, int]] = []
+    remaining = list(order)
+    while remaining:
+        top = remaining.pop(0)
+        opponent = min(remaining, key=lambda other: games[top, other])
+        remaining.remove(opponent)
+        pairs.append((top, opponent))
+    return pairs
+
+
+def swiss_pairings(
+    players: list[int],
+    h2h: H2HMatrix,
+    ratings: np.ndarray,
+    byes: np.ndarray,
+    rnd: int,
+) -> tuple[list[tuple[int, int]], Optional[int]]:
+    """
+    Swiss pairings for one round, computed from the results so far.
+
+    Players (h2h indices) are ranked by score, then rating, and paired top-down against the
+    closest ranked opponent they haven't met. Whoever has played white more often gets black.
+    With an odd number of players the lowest ranked player with the fewest byes sits out.
+
+    Returns a list of (white, black) pairings and the player with the bye, if any.
+    """
+    scores = h2h.scores()
+    order = sorted(players, key=lambda i: (-scores[i], -ratings[i], i))
+
+    bye = None
+    if len(order) % 2 == 1:
+        bye = min(reversed(order), key=lambda i: byes[i])
+        order.remove(bye)
+
+    games = h2h.counts.sum(axis=2)
+    pairs = _pair_without_rematches(order, games > 0)
+    if pairs is None:
+        # Everyone has met everyone (or close to it), start rematching
+        pairs = _pair_fewest_rematches(order, games)
+
+    whites = h2h.counts[:, :, H2HColumn.WHITE_WIN : H2HColumn.WHITE_LOSS + 1].sum(axis=(1, 2))
+    blacks = h2h.counts[:, :, H2HColumn.BLACK_WIN : H2HColumn.BLACK_LOSS + 1].sum(axis=(1, 2))
+    balance = whites - blacks
+
+    pairings: list[tuple[int, int]] = []
+    for higher, lower in pairs:
+        if balance[higher] != balance[lower]:
+            white_first = balance[higher] < balance[lower]
+        else:
+            # Alternate who gets white on equal balance between rounds
+            white_first = rnd % 2 == 0
+        pairings.append((higher, lower) if white_first else (lower, higher))
+
+    return pairings, bye
@@ -0,0 +1,79 @@
+import copy
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.board_start_builder import BoardStartBuilder, DefaultBSB, LastRowBSB
+from checkers_bot_tournament.move import Move
+from checkers_bot_tournament.piece import BLACK_MAN, EMPTY, WHITE_KING, WHITE_MAN, Colour
+
+
+class SquaresBSB(BoardStartBuilder):
+    """Starts from the given pieces, as {(row, col): code}."""
+
+    def __init__(self, pieces: dict[tuple[int, int], int], size: int = 8) -> None:
+        super().__init__(size)
+        self.pieces = pieces
+
+    def build(self) -> bytearray:
+        half = self.size // 2
+        squares = bytearray(self.size * half)
+        for (row, col), code in self.pieces.items():
+            squares[row * half + col // 2] = code
+        return squares
+
+
+def test_start_positions():
+    board = Board(DefaultBSB())
+    assert list(board.squares) == [BLACK_MAN] * 12 + [EMPTY] * 8 + [WHITE_MAN] * 12
+
+    board = Board(LastRowBSB(10), 10)
+    assert list(board.squares) == [BLACK_MAN] * 5 + [EMPTY] * 40 + [WHITE_MAN] * 5
+
+
+def test_grid_matches_squares():
+    board = Board(DefaultBSB())
+    grid = board.grid
+
+    # 22 is the first dark square of row 5
+    piece = grid[5][0]
+    assert piece is not None and piece.colour == Colour.WHITE and piece.position == (5, 0)
+    assert grid[5][1] is None
+    assert board.square_index(5, 0) == 20
+    assert board.square_position(20) == (5, 0)
+    assert board.get_piece((5, 0)).colour == Colour.WHITE
+
+
+def test_promotion():
+    board = Board(SquaresBSB({(1, 2): WHITE_MAN}))
+
+    capture, promotion = board.move_piece(Move((1, 2), (0, 1), None))
+
+    assert (capture, promotion) == (False, True)
+    assert board.squares[board.square_index(0, 1)] == WHITE_KING
+    # Kings try their forward directions first
+    assert board.get_move_list(Colour.WHITE) == [
+        Move((0, 1), (1, 2), None),
+        Move((0, 1), (1, 0), None),
+    ]
+
+
+def test_piece_sets_follow_moves_and_captures():
+    board = Board(SquaresBSB({(5, 0): WHITE_MAN, (4, 1): BLACK_MAN, (2, 1): BLACK_MAN}))
+    assert board.white_pieces == {20}
+    assert board.black_pieces == {16, 8}
+
+    board.move_piece(Move((5, 0), (3, 2), (4, 1)))
+
+    assert board.white_pieces == {13}
+    assert board.black_pieces == {8}
+    assert board.count_pieces(Colour.WHITE) == (1, 0)
+
+
+def test_deepcopy_is_independent():
+    board = Board(DefaultBSB())
+    board_copy = copy.deepcopy(board)
+    board_copy.move_piece(Move((5, 0), (4, 1), None))
+
+    assert board.squares[board.square_index(5, 0)] == WHITE_MAN
+    assert board.move_history == []
+    assert 20 in board.white_pieces and 20 not in board_copy.white_pieces
+    assert board_copy.squares[board.square_index(5, 0)] == EMPTY
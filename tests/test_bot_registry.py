@@ -0,0 +1,74 @@
+import sys
+
+import pytest
+
+from checkers_bot_tournament import bot_registry
+from checkers_bot_tournament.bot_registry import BotRegistry, class_spec, load_bot_class
+from checkers_bot_tournament.bots.first_mover import FirstMover
+
+BOT_SOURCE = """
+from checkers_bot_tournament.bots.base_bot import Bot
+from checkers_bot_tournament.bots.greedycat import GreedyCat
+
+
+class LastMover(Bot):
+    def play_move(self, board, colour, move_list):
+        return len(move_list) - 1
+
+    def get_name(self) -> str:
+        return "LastMover"
+
+
+class GreedierCat(GreedyCat):
+    def get_name(self) -> str:
+        return "GreedierCat"
+
+
+class Helper:
+    def get_name(self) -> str:
+        return "NotABot"
+"""
+
+
+@pytest.fixture
+def bot_dir(tmp_path):
+    directory = tmp_path / "bots"
+    directory.mkdir()
+    (directory / "my_bots.py").write_text(BOT_SOURCE)
+    return directory
+
+
+def test_directory_bots_are_found_without_importing_them(tmp_path, bot_dir):
+    registry = BotRegistry([str(bot_dir)], cache_path=str(tmp_path / "cache.json"))
+
+    assert {"FirstMover", "GreedyCat", "LastMover", "GreedierCat"} <= set(registry.names())
+    assert "NotABot" not in registry
+    assert registry.entries["LastMover"].source == "directory"
+    assert not any(name.startswith(bot_registry.FILE_MODULE_PREFIX) for name in sys.modules)
+
+    last_mover = registry.load("LastMover")
+    assert last_mover(bot_id=0).get_name() == "LastMover"
+    # The spec of a class loaded from a file can be loaded again, e.g. in another process
+    assert load_bot_class(class_spec(last_mover)) is last_mover
+
+
+def test_registry_cache_skips_unchanged_files(tmp_path, bot_dir, monkeypatch):
+    cache_path = str(tmp_path / "cache.json")
+    BotRegistry([str(bot_dir)], cache_path=cache_path)
+
+    def fail(*args):
+        raise AssertionError("cached file was parsed again")
+
+    monkeypatch.setattr(bot_registry, "scan_bot_classes", fail)
+    registry = BotRegistry([str(bot_dir)], cache_path=cache_path)
+    assert "LastMover" in registry
+
+
+def test_bots_given_as_specs(tmp_path, bot_dir):
+    registry = BotRegistry(cache_path=str(tmp_path / "cache.json"), entry_points=False)
+
+    assert registry.load("checkers_bot_tournament.bots.first_mover:FirstMover") is FirstMover
+    assert registry.load(f"{bot_dir / 'my_bots.py'}:GreedierCat")(0).get_name() == "GreedierCat"
+    # A file with more than one bot needs the class to be given
+    assert str(bot_dir / "my_bots.py") not in registry
+    assert "nope" not in registry
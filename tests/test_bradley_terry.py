@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from checkers_bot_tournament.bradley_terry import ELO_PER_NAT, fit_bradley_terry
+
+
+def test_equal_records_give_equal_ratings():
+    wins = np.array([[0, 5], [5, 0]])
+    draws = np.array([[0, 10], [10, 0]])
+    fit = fit_bradley_terry(wins, draws)
+
+    assert fit.ratings == pytest.approx([1500, 1500])
+    assert fit.std_errors[0] == pytest.approx(fit.std_errors[1])
+    # Half the games were drawn between equal bots: nu / (2 + nu) = 0.5
+    assert fit.draw_nu == pytest.approx(2.0, rel=0.05)
+
+
+def test_recovers_simulated_strengths():
+    rng = np.random.default_rng(0)
+    n = 20
+    strengths = rng.normal(0, 1, n)
+    nu = 0.5
+
+    white = rng.integers(0, n, 20000)
+    black = (white + rng.integers(1, n, 20000)) % n
+    a, b = np.exp(strengths[white]), np.exp(strengths[black])
+    draw_weight = nu * np.sqrt(a * b)
+    r = rng.random(20000) * (a + b + draw_weight)
+
+    wins = np.zeros((n, n))
+    draws = np.zeros((n, n))
+    np.add.at(wins, (white[r < a], black[r < a]), 1)
+    np.add.at(wins, (black[r >= a + draw_weight], white[r >= a + draw_weight]), 1)
+    drawn = (r >= a) & (r < a + draw_weight)
+    np.add.at(draws, (white[drawn], black[drawn]), 1)
+    np.add.at(draws, (black[drawn], white[drawn]), 1)
+
+    fit = fit_bradley_terry(wins, draws)
+    expected = 1500 + ELO_PER_NAT * (strengths - strengths.mean())
+
+    low, high = fit.interval(z=4)
+    assert np.all((low < expected) & (expected < high))
+    assert fit.draw_nu == pytest.approx(nu, rel=0.1)
+    assert fit.iterations < 20
@@ -0,0 +1,65 @@
+import os
+
+import numpy as np
+import pytest
+
+from checkers_bot_tournament.checkpoint import read_checkpoint
+from checkers_bot_tournament.controller import Controller
+
+
+def make_controller(output_dir: str, rounds: int) -> Controller:
+    return Controller(
+        mode="all",
+        board_start_builder="default",
+        pdn=None,
+        bot_name=None,
+        bot_names=["FirstMover", "ScaredyCat", "FirstMover"],
+        size=8,
+        rounds=rounds,
+        verbose=False,
+        output_dir=output_dir,
+        export_pdn=False,
+    )
+
+
+def test_resumed_run_matches_uninterrupted_run(tmp_path, monkeypatch):
+    """Stopping after round 1 and resuming gives the same results as playing straight through."""
+    full = make_controller(str(tmp_path / "full"), rounds=3)
+    full.run()
+
+    write_checkpoint = Controller._write_checkpoint
+
+    def write_checkpoint_then_stop(self, next_round):
+        write_checkpoint(self, next_round)
+        raise KeyboardInterrupt
+
+    partial = make_controller(str(tmp_path / "partial"), rounds=3)
+    with monkeypatch.context() as patch:
+        patch.setattr(Controller, "_write_checkpoint", write_checkpoint_then_stop)
+        with pytest.raises(KeyboardInterrupt):
+            partial.run()
+    folder = partial.game_results_folder
+    assert folder is not None
+
+    metadata, _ = read_checkpoint(folder)
+    assert metadata["next_round"] == 1
+
+    # Simulate a crash partway through writing round 1's summary
+    with open(os.path.join(folder, "game_result_summary.txt"), "a", encoding="utf-8") as file:
+        file.write("half a round")
+
+    resumed = Controller.resume(folder)
+    assert resumed.start_round == 1
+    resumed.run()
+
+    np.testing.assert_array_equal(resumed.h2h.counts, full.h2h.counts)
+    np.testing.assert_array_equal(resumed.elo.ratings, full.elo.ratings)
+    assert resumed.game_id_counter == full.game_id_counter
+
+    summaries = []
+    for controller in (full, resumed):
+        assert controller.game_results_folder is not None
+        path = os.path.join(controller.game_results_folder, "game_result_summary.txt")
+        with open(path, encoding="utf-8") as file:
+            summaries.append(file.read())
+    assert summaries[0] == summaries[1]
@@ -0,0 +1,78 @@
+import multiprocessing
+import threading
+from multiprocessing.connection import Client
+
+import numpy as np
+
+from checkers_bot_tournament.controller import Controller
+from checkers_bot_tournament.distributed import (
+    DEFAULT_AUTHKEY,
+    BotSpec,
+    Coordinator,
+    GameTask,
+    WorkerConfig,
+    run_worker,
+)
+
+
+def make_controller(output_dir: str, serve=None) -> Controller:
+    return Controller(
+        mode="all",
+        board_start_builder="default",
+        pdn=None,
+        bot_name=None,
+        bot_names=["FirstMover", "ScaredyCat", "FirstMover"],
+        size=8,
+        rounds=2,
+        verbose=False,
+        output_dir=output_dir,
+        export_pdn=False,
+        serve=serve,
+    )
+
+
+def test_workers_play_the_same_games_as_a_local_run(tmp_path):
+    local = make_controller(str(tmp_path / "local"))
+    local.run()
+
+    served = make_controller(str(tmp_path / "served"), serve="localhost:0")
+    assert served.coordinator is not None
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=run_worker, args=(served.coordinator.address,)) for _ in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    served.run()
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    np.testing.assert_array_equal(served.h2h.counts, local.h2h.counts)
+    np.testing.assert_array_equal(served.elo.ratings, local.elo.ratings)
+    for local_results, served_results in zip(local.game_results, served.game_results):
+        assert local_results == served_results
+
+
+def test_games_of_a_lost_worker_are_requeued():
+    config = WorkerConfig("default", 8, None, False, None, seed=0)
+    coordinator = Coordinator(("localhost", 0), config, batch_size=2)
+    white = BotSpec("checkers_bot_tournament.bots.first_mover:FirstMover", 0, 1500.0)
+    black = BotSpec("checkers_bot_tournament.bots.scaredycat:ScaredyCat", 1, 1500.0)
+    tasks = [GameTask(game_id, 0, white, black) for game_id in range(1, 5)]
+
+    # Takes a batch and disconnects without playing it
+    with Client(coordinator.address, authkey=DEFAULT_AUTHKEY) as flaky:
+        flaky.recv()
+        results: list = []
+        runner = threading.Thread(target=lambda: results.extend(coordinator.run_games(tasks)))
+        runner.start()
+        assert len(flaky.recv()) == 2
+
+    worker = threading.Thread(target=run_worker, args=(coordinator.address,))
+    worker.start()
+    runner.join(timeout=30)
+    coordinator.close()
+    worker.join(timeout=30)
+
+    assert [result.game_id for result in results] == [1, 2, 3, 4]
@@ -0,0 +1,53 @@
+import numpy as np
+
+from checkers_bot_tournament.elo import EloConfig, EloRatings
+
+
+def rate_round_scalar(
+    ratings: list[float], games_played: list[int], games: list[tuple[int, int, float]]
+) -> None:
+    """Per-game, per-bot reference implementation of the Elo update."""
+    evs: list[list[float]] = [[] for _ in ratings]
+    scores: list[list[float]] = [[] for _ in ratings]
+    for white, black, white_score in games:
+        Qa = 10 ** (ratings[white] / EloConfig.SCALE)
+        Qb = 10 ** (ratings[black] / EloConfig.SCALE)
+        ev_white = Qa / (Qa + Qb)
+        evs[white].append(ev_white)
+        evs[black].append(1 - ev_white)
+        scores[white].append(white_score)
+        scores[black].append(1 - white_score)
+
+    for bot in range(len(ratings)):
+        if not evs[bot]:
+            continue
+        K = EloConfig.STARTING_KFACTOR / (games_played[bot] + len(evs[bot]))
+        ratings[bot] += K * (sum(scores[bot]) - sum(evs[bot]))
+        games_played[bot] += len(evs[bot])
+
+
+def test_vectorized_round_matches_scalar_updates():
+    rng = np.random.default_rng(1)
+    num_bots = 12
+    elo = EloRatings(num_bots)
+    ratings = [EloConfig.STARTING_ELO] * num_bots
+    games_played = [0] * num_bots
+
+    for _ in range(5):
+        # Leave the last bot out so that bots without games are covered too
+        white = rng.integers(0, num_bots - 1, size=300)
+        black = (white + rng.integers(1, num_bots - 1, size=300)) % (num_bots - 1)
+        codes = rng.integers(0, 3, size=300)
+
+        elo.rate_round(white, black, codes)
+        white_scores = [1.0, 0.5, 0.0]
+        rate_round_scalar(
+            ratings,
+            games_played,
+            [(int(w), int(b), white_scores[c]) for w, b, c in zip(white, black, codes)],
+        )
+
+        assert elo.ratings.tolist() == ratings
+        assert elo.games_played.tolist() == games_played
+
+    assert elo.ratings[-1] == EloConfig.STARTING_ELO
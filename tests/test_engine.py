@@ -0,0 +1,83 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from checkers_bot_tournament.controller import Controller
+from checkers_bot_tournament.game_result import Result
+
+FIRST_MOVE_ENGINE = """
+import sys
+
+for line in sys.stdin:
+    request = line.split()
+    if request[0] == "hello":
+        print("hello first", flush=True)
+    elif request[0] == "move":
+        print(request[1], 0, flush=True)
+    elif request[0] == "quit":
+        break
+"""
+
+CRASHING_ENGINE = """
+import sys
+
+print("hello crash", flush=True)
+sys.stdin.readline()
+sys.stdin.readline()
+sys.exit(1)
+"""
+
+
+@pytest.fixture
+def write_engine(tmp_path):
+    def write(name: str, source: str) -> str:
+        path = tmp_path / name
+        path.write_text(f"#!{sys.executable}\n{source}")
+        os.chmod(path, 0o755)
+        return str(path)
+
+    return write
+
+
+def run_all(output_dir: str, bot_names: list[str]) -> Controller:
+    controller = Controller(
+        mode="all",
+        board_start_builder="default",
+        pdn=None,
+        bot_name=None,
+        bot_names=bot_names,
+        size=8,
+        rounds=2,
+        verbose=False,
+        output_dir=output_dir,
+        export_pdn=False,
+        engine_processes=2,
+    )
+    controller.run()
+    return controller
+
+
+def test_engine_plays_like_the_bot_it_mirrors(tmp_path, write_engine):
+    engine = write_engine("first_engine", FIRST_MOVE_ENGINE)
+    external = run_all(str(tmp_path / "external"), [engine, "ScaredyCat", engine])
+    local = run_all(str(tmp_path / "local"), ["FirstMover", "ScaredyCat", "FirstMover"])
+
+    assert external.bot_list[0].bot.get_name() == "first_engine"
+    np.testing.assert_array_equal(external.h2h.counts, local.h2h.counts)
+    # Both instances shared the engine's processes
+    assert len(external.engines) == 1
+
+
+def test_crashed_engine_forfeits_its_games(tmp_path, write_engine):
+    engine = write_engine("crash_engine", CRASHING_ENGINE)
+    controller = run_all(str(tmp_path / "crash"), [engine, "ScaredyCat"])
+
+    for game_results in controller.game_results:
+        for game_result in game_results:
+            assert game_result.winner_name == "[1] ScaredyCat"
+            # White forfeits on its first move, black only after white's first move
+            expected = Result.BLACK if game_result.white_name.endswith("crash_engine") else None
+            if expected is not None:
+                assert game_result.result == expected
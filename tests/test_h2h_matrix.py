@@ -0,0 +1,33 @@
+import numpy as np
+
+from checkers_bot_tournament.bots.bot_tracker import RESULT_CODES, GameResultStat, H2HMatrix
+from checkers_bot_tournament.game_result import Result
+
+
+def test_register_updates_both_perspectives():
+    h2h = H2HMatrix(3)
+    h2h.register(0, 1, Result.WHITE)
+    h2h.register(1, 0, Result.DRAW)
+    h2h.register(2, 0, Result.BLACK)
+
+    assert h2h.stat(0, 1) == GameResultStat(white_wins=1, black_draws=1)
+    assert h2h.stat(1, 0) == GameResultStat(black_losses=1, white_draws=1)
+    assert h2h.stat(0, 2) == GameResultStat(black_wins=1)
+    assert h2h.totals(0) == GameResultStat(white_wins=1, black_draws=1, black_wins=1)
+    assert list(h2h.scores()) == [2.5, 0.5, 0.0]
+
+
+def test_batch_register_matches_single_register():
+    rng = np.random.default_rng(0)
+    white = rng.integers(0, 5, size=200)
+    black = (white + rng.integers(1, 5, size=200)) % 5
+    results = rng.choice([Result.WHITE, Result.DRAW, Result.BLACK], size=200)
+
+    single = H2HMatrix(5)
+    for w, b, result in zip(white, black, results):
+        single.register(w, b, result)
+
+    batch = H2HMatrix(5)
+    batch.register_results(white, black, np.array([RESULT_CODES[r] for r in results]))
+
+    assert np.array_equal(single.counts, batch.counts)
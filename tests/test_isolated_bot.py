@@ -0,0 +1,57 @@
+import numpy as np
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.bots.base_bot import Bot
+from checkers_bot_tournament.controller import Controller
+from checkers_bot_tournament.move import Move
+from checkers_bot_tournament.piece import Colour
+
+
+class RaisingBot(Bot):
+    def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
+        raise ValueError("oops")
+
+    def get_name(self) -> str:
+        return "RaisingBot"
+
+
+def run_all(output_dir: str, bot_names: list[str], isolate_bots: bool) -> Controller:
+    controller = Controller(
+        mode="all",
+        board_start_builder="default",
+        pdn=None,
+        bot_name=None,
+        bot_names=bot_names,
+        size=8,
+        rounds=2,
+        verbose=False,
+        output_dir=output_dir,
+        export_pdn=False,
+        isolate_bots=isolate_bots,
+    )
+    controller.run()
+    return controller
+
+
+def test_isolated_bots_play_the_same_games(tmp_path):
+    bot_names = ["FirstMover", "ScaredyCat"]
+    local = run_all(str(tmp_path / "local"), bot_names, isolate_bots=False)
+    isolated = run_all(str(tmp_path / "isolated"), bot_names, isolate_bots=True)
+
+    np.testing.assert_array_equal(isolated.h2h.counts, local.h2h.counts)
+    for local_results, isolated_results in zip(local.game_results, isolated.game_results):
+        assert [r.moves_pdn for r in local_results] == [r.moves_pdn for r in isolated_results]
+
+    bot = isolated.bot_list[1].bot
+    assert bot.get_name() == "ScaredyCat"
+    assert bot.moves > 0
+
+
+def test_raising_bot_forfeits_instead_of_stopping_the_tournament(tmp_path):
+    raising_bot = f"{__name__}:RaisingBot"
+    controller = run_all(str(tmp_path / "raising"), [raising_bot, "FirstMover"], True)
+
+    assert controller.bot_list[0].bot.get_name() == "RaisingBot"
+    for game_results in controller.game_results:
+        for game_result in game_results:
+            assert game_result.winner_name == "[1] FirstMover"
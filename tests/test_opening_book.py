@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.board_start_builder import DefaultBSB
+from checkers_bot_tournament.bots.scaredycat import ScaredyCat
+from checkers_bot_tournament.opening_book import OpeningBook
+from checkers_bot_tournament.piece import Colour
+from checkers_bot_tournament.position_index import PositionIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Three games from the start: 22-17 scores a win and a draw for white, 22-18 a loss."""
+    # Unfinished games replay as draws, so set the results by hand
+    index = PositionIndex(str(tmp_path / "positions.db"))
+    index.add_games("tourney", [(1, "22-17 11-15"), (2, "22-17 9-13"), (3, "22-18 11-15")])
+    with index.conn:
+        index.conn.execute("UPDATE games SET result = 'WHITE' WHERE game_id = 1")
+        index.conn.execute("UPDATE games SET result = 'BLACK' WHERE game_id = 3")
+    yield index
+    index.close()
+
+
+def test_book_prefers_best_scoring_move(index):
+    book = OpeningBook.from_index(index)
+    board = Board(DefaultBSB())
+    move_list = board.get_move_list(Colour.WHITE)
+
+    book_move = book.probe(board, Colour.WHITE, move_list)
+    assert book_move is not None
+    assert (move_list[book_move].start, move_list[book_move].end) == ((5, 2), (4, 1))  # 22-17
+
+    # Weighted choice never picks a move outside the book
+    rng = random.Random(0)
+    for _ in range(20):
+        assert book.probe(board, Colour.WHITE, move_list, rng) is not None
+
+    # Not in book
+    assert book.probe(board, Colour.BLACK, board.get_move_list(Colour.BLACK)) is None
+
+
+def test_book_thresholds_and_round_trip(tmp_path, index):
+    # Only the start position was reached 3 times, and 22-17 twice
+    assert len(OpeningBook.from_index(index, min_games=3)) == 1
+    assert len(OpeningBook.from_index(index, min_games=2, max_positions=1)) == 1
+    assert len(OpeningBook.from_index(index, max_ply=1)) == 1
+
+    book = OpeningBook.from_index(index)
+    path = str(tmp_path / "book.bin")
+    book.save(path)
+    loaded = OpeningBook.load(path)
+    assert loaded.size == book.size
+    assert {key: sorted(moves) for key, moves in loaded.entries.items()} == {
+        key: sorted(moves) for key, moves in book.entries.items()
+    }
+
+
+def test_bot_plays_book_move(index):
+    bot = ScaredyCat(0)
+    board = Board(DefaultBSB())
+    move_list = board.get_move_list(Colour.WHITE)
+    assert bot.probe_book(board, Colour.WHITE, move_list) is None
+
+    bot.opening_book = OpeningBook.from_index(index)
+    book_move = bot.probe_book(board, Colour.WHITE, move_list)
+    assert book_move is not None
+    assert bot.play_move(board, Colour.WHITE, move_list) == book_move
@@ -0,0 +1,55 @@
+import pytest
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.board_start_builder import DefaultBSB
+from checkers_bot_tournament.game_result import Result
+from checkers_bot_tournament.piece import Colour
+from checkers_bot_tournament.position_hash import position_hash
+from checkers_bot_tournament.position_index import PositionIndex, replay_pdn
+
+
+@pytest.fixture
+def sample_pdn():
+    return "22-17 11-15 24-20 15-19 23x16 12x19 27-24 9-13 24x15 13x22"
+
+
+@pytest.fixture
+def results_folder(tmp_path, sample_pdn):
+    """A results folder as written by --export-pdn."""
+    folder = tmp_path / "checkers_game_results_20241208_120000"
+    folder.mkdir()
+    (folder / "game_1.pdn").write_text(sample_pdn)
+    (folder / "game_2.pdn").write_text("22-18 11-15 18x11")
+    return folder
+
+
+def test_replay_hashes_every_position(sample_pdn):
+    replayed = replay_pdn(sample_pdn, DefaultBSB())
+
+    # One entry per move plus the final position
+    assert len(replayed.positions) == 11
+    assert replayed.positions[0] == (position_hash(Board(DefaultBSB()), Colour.WHITE), "22-17")
+    assert replayed.positions[-1][1] is None
+    # Both sides still have moves, so an unfinished game is recorded as a draw
+    assert replayed.result == Result.DRAW
+
+
+def test_position_hash_depends_on_side_to_move():
+    board = Board(DefaultBSB())
+    assert position_hash(board, Colour.WHITE) != position_hash(board, Colour.BLACK)
+
+
+def test_index_query_and_incremental_update(tmp_path, results_folder):
+    with PositionIndex(str(tmp_path / "positions.db")) as index:
+        assert index.add_folder(str(results_folder)) == 2
+
+        start = index.query_board(Board(DefaultBSB()), Colour.WHITE)
+        assert start.total_games == 2
+        assert start.moves == {"22-17": 1, "22-18": 1}
+        assert sorted(start.games) == [(results_folder.name, 1), (results_folder.name, 2)]
+
+        # Re-adding the same folder only picks up new games
+        assert index.add_folder(str(results_folder)) == 0
+        (results_folder / "game_3.pdn").write_text("22-17 9-13")
+        assert index.add_folder(str(results_folder)) == 1
+        assert index.query_board(Board(DefaultBSB()), Colour.WHITE).moves["22-17"] == 2
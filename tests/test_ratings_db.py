@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+from checkers_bot_tournament.controller import Controller
+from checkers_bot_tournament.elo import EloConfig
+from checkers_bot_tournament.ratings_db import RatingsDB
+
+
+def run_tournament(output_dir: str, ratings_db: str) -> Controller:
+    controller = Controller(
+        mode="all",
+        board_start_builder="default",
+        pdn=None,
+        bot_name=None,
+        bot_names=["FirstMover", "ScaredyCat", "ScaredyCat"],
+        size=8,
+        rounds=2,
+        verbose=False,
+        output_dir=output_dir,
+        export_pdn=False,
+        ratings_db=ratings_db,
+    )
+    controller.run()
+    return controller
+
+
+def test_ratings_carry_over_between_runs(tmp_path):
+    db_path = str(tmp_path / "ratings.db")
+    first = run_tournament(str(tmp_path / "first"), db_path)
+
+    with RatingsDB(db_path) as db:
+        stored = db.load(["FirstMover", "ScaredyCat", "RandomBot"])
+        assert set(stored) == {"FirstMover", "ScaredyCat"}
+        # 2 rounds of a 3 bot double round robin: 4 games each, 8 for the two ScaredyCats
+        assert stored["FirstMover"] == (first.bot_list[0].rating, 8)
+        assert stored["ScaredyCat"][1] == 16
+        assert len(db.rating_trend("ScaredyCat")) == 2
+        assert db.rating_trend("ScaredyCat", datetime.now() + timedelta(days=1)) == []
+
+    second = Controller(
+        mode="all",
+        board_start_builder="default",
+        pdn=None,
+        bot_name=None,
+        bot_names=["ScaredyCat", "RandomBot"],
+        size=8,
+        rounds=1,
+        verbose=False,
+        output_dir=str(tmp_path / "second"),
+        export_pdn=False,
+        ratings_db=db_path,
+    )
+    assert second.bot_list[0].rating == stored["ScaredyCat"][0]
+    assert second.bot_list[0].games_played == 16
+    assert second.bot_list[1].rating == EloConfig.STARTING_ELO
+    assert second.bot_list[1].games_played == 0
+    assert second.ratings_db is not None
+    second.ratings_db.close()
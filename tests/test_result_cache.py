@@ -0,0 +1,60 @@
+import numpy as np
+
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.bots.first_mover import FirstMover
+from checkers_bot_tournament.controller import Controller
+from checkers_bot_tournament.move import Move
+from checkers_bot_tournament.piece import Colour
+
+
+class CountingFirstMover(FirstMover):
+    """FirstMover that counts the moves it is asked for, across all instances."""
+
+    moves_played = 0
+
+    def play_move(self, board: Board, colour: Colour, move_list: list[Move]) -> int:
+        CountingFirstMover.moves_played += 1
+        return super().play_move(board, colour, move_list)
+
+    def get_name(self) -> str:
+        return "CountingFirstMover"
+
+
+class UncachedFirstMover(CountingFirstMover):
+    deterministic = False
+
+
+def run_all(output_dir: str, bot_names: list[str]) -> Controller:
+    controller = Controller(
+        mode="all",
+        board_start_builder="default",
+        pdn=None,
+        bot_name=None,
+        bot_names=bot_names,
+        size=8,
+        rounds=3,
+        verbose=False,
+        output_dir=output_dir,
+        export_pdn=False,
+    )
+    controller.run()
+    return controller
+
+
+def test_deterministic_pairings_are_played_once(tmp_path):
+    CountingFirstMover.moves_played = 0
+    cached = run_all(str(tmp_path / "cached"), [f"{__name__}:CountingFirstMover", "ScaredyCat"])
+    cached_moves = CountingFirstMover.moves_played
+
+    CountingFirstMover.moves_played = 0
+    uncached = run_all(str(tmp_path / "uncached"), [f"{__name__}:UncachedFirstMover", "ScaredyCat"])
+
+    # Two pairings (one per colour), played in the first round only
+    assert len(cached.result_cache) == 2
+    assert cached_moves * 3 == CountingFirstMover.moves_played
+    np.testing.assert_array_equal(cached.h2h.counts, uncached.h2h.counts)
+    for cached_results, uncached_results in zip(cached.game_results, uncached.game_results):
+        for cached_result, uncached_result in zip(cached_results, uncached_results):
+            assert cached_result.game_id == uncached_result.game_id
+            assert cached_result.game_round == uncached_result.game_round
+            assert cached_result.moves_pdn == uncached_result.moves_pdn
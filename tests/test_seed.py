@@ -0,0 +1,73 @@
+from checkers_bot_tournament.board import Board
+from checkers_bot_tournament.board_start_builder import board_start_builder_mapping
+from checkers_bot_tournament.bots.bot_tracker import BotTracker, H2HMatrix
+from checkers_bot_tournament.bots.random_bot import RandomBot
+from checkers_bot_tournament.controller import Controller
+from checkers_bot_tournament.elo import EloRatings
+from checkers_bot_tournament.game import Game
+
+
+def run_all(
+    output_dir: str,
+    seed: int,
+    isolate_bots: bool = False,
+    bot_names: tuple[str, ...] = ("RandomBot", "CopyCat"),
+) -> Controller:
+    controller = Controller(
+        mode="all",
+        board_start_builder="default",
+        pdn=None,
+        bot_name=None,
+        bot_names=list(bot_names),
+        size=8,
+        rounds=2,
+        verbose=False,
+        output_dir=output_dir,
+        export_pdn=False,
+        isolate_bots=isolate_bots,
+        seed=seed,
+    )
+    controller.run()
+    return controller
+
+
+def all_moves(controller: Controller) -> list[str]:
+    return [r.moves_pdn for results in controller.game_results for r in results]
+
+
+def test_same_seed_plays_the_same_games(tmp_path):
+    first = run_all(str(tmp_path / "first"), seed=7)
+    second = run_all(str(tmp_path / "second"), seed=7)
+    other = run_all(str(tmp_path / "other"), seed=8)
+
+    assert all_moves(first) == all_moves(second)
+    assert all_moves(first) != all_moves(other)
+
+
+def test_isolated_bots_get_the_same_random_numbers(tmp_path):
+    local = run_all(str(tmp_path / "local"), seed=7)
+    isolated = run_all(str(tmp_path / "isolated"), seed=7, isolate_bots=True)
+
+    assert all_moves(local) == all_moves(isolated)
+
+
+def test_game_can_be_replayed_on_its_own(tmp_path):
+    controller = run_all(str(tmp_path / "tournament"), 7, bot_names=("RandomBot", "RandomBot"))
+    game_result = controller.game_results[1][0]
+
+    h2h = H2HMatrix(2)
+    elo = EloRatings(2)
+    white = BotTracker(bot=RandomBot(bot_id=0), h2h=h2h, elo=elo, index=0)
+    black = BotTracker(bot=RandomBot(bot_id=1), h2h=h2h, elo=elo, index=1)
+    replay = Game(
+        white,
+        black,
+        Board(board_start_builder_mapping["default"](8)),
+        game_result.game_id,
+        game_result.game_round,
+        False,
+        None,
+        seed=7,
+    )
+
+    assert replay.run().moves_pdn == game_result.moves_pdn
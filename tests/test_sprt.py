@@ -0,0 +1,20 @@
+import pytest
+
+from checkers_bot_tournament.sprt import SPRTConfig, SPRTResult, sprt_llr, sprt_status
+
+
+def test_llr_sign_and_symmetry():
+    assert sprt_llr(0, 0, 0, -20, 20) == 0
+    assert sprt_llr(30, 10, 10, -20, 20) > 0
+    assert sprt_llr(10, 10, 30, -20, 20) < 0
+    # Symmetric hypotheses: swapping wins and losses flips the LLR
+    assert sprt_llr(30, 10, 10, -20, 20) == pytest.approx(-sprt_llr(10, 10, 30, -20, 20))
+
+
+def test_status_needs_more_than_a_couple_of_games():
+    config = SPRTConfig()
+    assert sprt_status(2, 0, 0, config) == SPRTResult.UNDECIDED
+    assert sprt_status(20, 0, 0, config) == SPRTResult.BETTER
+    assert sprt_status(0, 0, 20, config) == SPRTResult.WORSE
+    # An even match stays undecided
+    assert sprt_status(50, 20, 50, config) == SPRTResult.UNDECIDED
@@ -0,0 +1,40 @@
+import numpy as np
+
+from checkers_bot_tournament.bots.bot_tracker import H2HMatrix
+from checkers_bot_tournament.game_result import Result
+from checkers_bot_tournament.swiss import swiss_pairings
+
+
+def test_pairs_by_score_without_rematches_and_balances_colours():
+    h2h = H2HMatrix(4)
+    ratings = np.full(4, 1500.0)
+    byes = np.zeros(4, dtype=np.int64)
+
+    # Round 0: everyone level, so bots pair in index order
+    pairings, bye = swiss_pairings([0, 1, 2, 3], h2h, ratings, byes, 0)
+    assert bye is None
+    assert pairings == [(0, 1), (2, 3)]
+
+    h2h.register(0, 1, Result.WHITE)
+    h2h.register(2, 3, Result.BLACK)
+
+    # Round 1: winners (0 and 3) meet, losers (1 and 2) meet, and whoever had white gets black
+    pairings, bye = swiss_pairings([0, 1, 2, 3], h2h, ratings, byes, 1)
+    assert sorted(tuple(sorted(pair)) for pair in pairings) == [(0, 3), (1, 2)]
+    assert (3, 0) in pairings
+    assert (1, 2) in pairings
+
+
+def test_odd_field_gives_bye_to_lowest_ranked_without_one():
+    h2h = H2HMatrix(3)
+    ratings = np.array([1600.0, 1500.0, 1400.0])
+    byes = np.zeros(3, dtype=np.int64)
+
+    pairings, bye = swiss_pairings([0, 1, 2], h2h, ratings, byes, 0)
+    assert bye == 2
+    assert pairings == [(0, 1)]
+
+    byes[2] += 1
+    h2h.register(0, 1, Result.WHITE)
+    _, bye = swiss_pairings([0, 1, 2], h2h, ratings, byes, 1)
+    assert bye == 1